@@ -1,489 +1,1064 @@
-# EventDataEnhancer.py
-
-import os
-import requests
-import logging
-from typing import List, Dict, Any, Optional
-import re
-from datetime import datetime, time
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('EventDataEnhancer')
-
-# API Configuration
-GOOGLE_PLACES_API_KEY = os.environ.get("GOOGLE_PLACES_API_KEY")
-
-# Log warning if API key is missing
-if not GOOGLE_PLACES_API_KEY:
-    logger.warning("GOOGLE_PLACES_API_KEY environment variable is not set. Location enhancement will be limited.")
-
-def get_location_details(location_query: str) -> Dict[str, Any]:
-    """
-    Get detailed location information from Google Places API using a query string.
-
-    Args:
-        location_query: Location query string (e.g., "Pensacola, FL" or "Saenger Theatre, Pensacola")
-
-    Returns:
-        Dictionary containing location details (city, state, country, district, lat, lng, formatted_address)
-    """
-    # Initialize the result dictionary with default values
-    location_data = {
-        "city": "",
-        "state": "",
-        "country": "",
-        "district": "",
-        "lat": None,
-        "lng": None,
-        "formatted_address": ""  # Add formatted_address field for full venue address
-    }
-
-    if not GOOGLE_PLACES_API_KEY:
-        logger.error("GOOGLE_PLACES_API_KEY is not set. Cannot fetch location details.")
-        return location_data
-
-    if not location_query:
-        logger.warning("Empty location query provided")
-        return location_data
-
-    logger.info(f"Getting location details for: '{location_query}'")
-
-    # Geocoding API endpoint
-    endpoint = "https://maps.googleapis.com/maps/api/geocode/json"
-
-    # Parameters for the API request
-    params = {
-        "address": location_query,
-        "key": GOOGLE_PLACES_API_KEY
-    }
-    
-    try:
-        # Make the API request
-        response = requests.get(endpoint, params=params)
-        data = response.json()
-        
-        # Check if the request was successful
-        if data["status"] == "OK" and len(data["results"]) > 0:
-            # Get the first result
-            result = data["results"][0]
-            
-            # Store the formatted address
-            location_data["formatted_address"] = result.get("formatted_address", "")
-            
-            # Extract coordinates
-            location = result["geometry"]["location"]
-            location_data["lat"] = location["lat"]
-            location_data["lng"] = location["lng"]
-            
-            # Extract address components
-            address_components = result["address_components"]
-            
-            for component in address_components:
-                # City (locality)
-                if "locality" in component["types"]:
-                    location_data["city"] = component["long_name"]
-                
-                # District (administrative_area_level_2)
-                elif "administrative_area_level_2" in component["types"]:
-                    location_data["district"] = component["long_name"]
-                
-                # State (administrative_area_level_1)
-                elif "administrative_area_level_1" in component["types"]:
-                    location_data["state"] = component["long_name"]
-                    # Also store the state code (e.g., "FL")
-                    location_data["state_code"] = component["short_name"]
-                
-                # Country
-                elif "country" in component["types"]:
-                    location_data["country"] = component["long_name"]
-                    # Also store the country code (e.g., "US")
-                    location_data["country_code"] = component["short_name"]
-            
-            logger.info(f"Found location details for '{location_query}': {location_data['city']}, {location_data['state']}")
-            if location_data["formatted_address"]:
-                logger.info(f"Found address: {location_data['formatted_address']}")
-        else:
-            logger.warning(f"Could not find location details for '{location_query}': {data['status']}")
-    
-    except Exception as e:
-        logger.error(f"Error getting location details for '{location_query}': {str(e)}")
-    
-    return location_data
-
-def format_dates_and_times(event: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Format and validate date and time fields in an event.
-    
-    Args:
-        event: Event dictionary
-        
-    Returns:
-        Event with formatted date and time fields
-    """
-    # Default values
-    today = datetime.now().strftime('%Y-%m-%d')
-    default_start_time = "18:00:00"
-    default_end_time = "23:59:59"
-    
-    # Ensure start_date exists
-    if not event.get('start_date'):
-        # Try to extract from date field if it exists
-        if event.get('date'):
-            # Try different date formats
-            date_patterns = [
-                r'(\d{4}-\d{2}-\d{2})',  # YYYY-MM-DD
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                r'([A-Za-z]+ \d{1,2}, \d{4})'  # Month DD, YYYY
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, event['date'])
-                if match:
-                    # Found a date match, try to parse it
-                    try:
-                        if '-' in match.group(1):  # YYYY-MM-DD
-                            event['start_date'] = match.group(1)
-                        elif '/' in match.group(1):  # MM/DD/YYYY
-                            parts = match.group(1).split('/')
-                            event['start_date'] = f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
-                        else:  # Month DD, YYYY
-                            date_obj = datetime.strptime(match.group(1), '%B %d, %Y')
-                            event['start_date'] = date_obj.strftime('%Y-%m-%d')
-                        break
-                    except (ValueError, IndexError):
-                        continue
-        
-        # If still no start_date, use today
-        if not event.get('start_date'):
-            event['start_date'] = today
-    
-    # Ensure end_date exists
-    if not event.get('end_date'):
-        event['end_date'] = event['start_date']
-    
-    # Ensure start_time exists
-    if not event.get('start_time'):
-        # Try to extract from date field if it exists
-        if event.get('date'):
-            # Try to find time
-            time_pattern = r'(\d{1,2}):(\d{2})(?:\s*)(AM|PM)?'
-            match = re.search(time_pattern, event.get('date', ''))
-            if match:
-                hour = int(match.group(1))
-                minute = match.group(2)
-                am_pm = match.group(3)
-                
-                # Handle AM/PM
-                if am_pm and am_pm.upper() == 'PM' and hour < 12:
-                    hour += 12
-                elif am_pm and am_pm.upper() == 'AM' and hour == 12:
-                    hour = 0
-                
-                event['start_time'] = f"{hour:02}:{minute}:00"
-            else:
-                event['start_time'] = default_start_time
-        else:
-            event['start_time'] = default_start_time
-    
-    # Ensure end_time exists
-    if not event.get('end_time'):
-        event['end_time'] = default_end_time
-    
-    return event
-
-def get_event_address(event: Dict[str, Any], location_data: Dict[str, Any]) -> str:
-    """
-    Format a full address for the event based on available data.
-    
-    Args:
-        event: Event dictionary
-        location_data: Location data from Google API
-        
-    Returns:
-        Formatted address string
-    """
-    # If we have a formatted address from the API, use it
-    if location_data.get('formatted_address'):
-        return location_data['formatted_address']
-    
-    # Otherwise, try to build a reasonable address from venue and location
-    venue = event.get('venue', '')
-    city = event.get('city', location_data.get('city', ''))
-    state = event.get('state', location_data.get('state', ''))
-    country = event.get('country', location_data.get('country', ''))
-    
-    # Construct address components
-    address_parts = []
-    
-    if venue:
-        address_parts.append(venue)
-    
-    location_part = ", ".join(p for p in [city, state] if p)
-    if location_part:
-        address_parts.append(location_part)
-    
-    if country and country != "United States":  # Only add country if not US (common convention)
-        address_parts.append(country)
-    
-    if not address_parts:
-        return ""
-    
-    return ", ".join(address_parts)
-
-
-
-from typing import Dict, Any, List
-
-def infer_event_tags(event: Dict[str, Any]) -> List[int]:
-    """
-    Infer event tags based on description and title.
-    
-    Args:
-        event: Event dictionary
-        
-    Returns:
-        List of tag IDs
-    """
-    # Define tag categories and associated keywords using the correct tag IDs
-    tag_categories = {
-        # Live Music (ID: 1)
-        1: ['live music', 'concert', 'musician', 'band', 'performance', 'singer', 'gig'],
-        
-        # Nightlife (ID: 2)
-        2: ['nightlife', 'club', 'bar', 'pub', 'party', 'nightclub', 'disco', 'DJ'],
-        
-        # Comedy (ID: 3)
-        3: ['comedy', 'comedian', 'stand-up', 'improv', 'humorous', 'funny', 'laugh'],
-        
-        # Family-Friendly (ID: 4)
-        4: ['family', 'kids', 'children', 'child', 'youth', 'family-friendly', 'all ages'],
-        
-        # Food Festival (ID: 5)
-        5: ['food', 'culinary', 'cuisine', 'tasting', 'dining', 'restaurant', 'chef', 'wine', 'beer'],
-        
-        # Sports (ID: 6)
-        6: ['sports', 'game', 'match', 'tournament', 'athletics', 'competition', 'team', 'league'],
-        
-        # Art Exhibition (ID: 7)
-        7: ['art', 'gallery', 'exhibition', 'museum', 'artist', 'painting', 'sculpture'],
-        
-        # Networking (ID: 8)
-        8: ['network', 'networking', 'social', 'meetup', 'mixer', 'professional', 'business', 'entrepreneur'],
-        
-        # Tech Meetup (ID: 9)
-        9: ['tech', 'technology', 'coding', 'programming', 'developer', 'software', 'hardware', 'startup', 'innovation'],
-        
-        # Charity Event (ID: 10)
-        10: ['charity', 'fundraiser', 'nonprofit', 'donation', 'cause', 'benefit', 'volunteer'],
-        
-        # Educational (ID: 11)
-        11: ['education', 'learning', 'workshop', 'class', 'seminar', 'lecture', 'training', 'conference'],
-        
-        # Dance Party (ID: 12)
-        12: ['dance', 'dancing', 'choreography', 'ballroom', 'salsa', 'hip-hop', 'ballet'],
-        
-        # Outdoor (ID: 13)
-        13: ['outdoor', 'outside', 'park', 'nature', 'garden', 'field', 'yard', 'plaza'],
-        
-        # Indoor (ID: In: 14)
-        14: ['indoor', 'inside', 'venue', 'hall', 'center', 'building', 'auditorium'],
-        
-        # Virtual Event (ID: 15)
-        15: ['virtual', 'online', 'digital', 'remote', 'zoom', 'stream', 'webinar'],
-        
-        # Gaming Tournament (ID: 16)
-        16: ['gaming', 'game', 'tournament', 'esports', 'video game', 'console', 'competition'],
-        
-        # Health & Wellness (ID: 17)
-        17: ['health', 'wellness', 'fitness', 'well-being', 'mindfulness', 'self-care', 'spa', 'retreat'],
-        
-        # Yoga (ID: 18)
-        18: ['yoga', 'meditation', 'mindfulness', 'stretching', 'poses', 'asana'],
-        
-        # Meditation (ID: 19)
-        19: ['meditation', 'mindfulness', 'relaxation', 'spiritual', 'zen', 'calm', 'peace'],
-        
-        # Concert (ID: 20)
-        20: ['concert', 'symphony', 'orchestra', 'philharmonic', 'recital', 'show', 'musical'],
-        
-        # Theater (ID: 21)
-        21: ['theater', 'theatre', 'play', 'drama', 'performance', 'stage', 'acting', 'broadway']
-    }
-    
-    # Get text to analyze
-    title = event.get('name', event.get('title', '')).lower()
-    description = event.get('description', '').lower()
-    venue = event.get('venue', event.get('address', '')).lower()
-    full_text = f"{title} {description} {venue}"
-    
-    # Find matching tags
-    matched_tags = set()
-    
-    # First pass: look for exact keyword matches
-    for tag_id, keywords in tag_categories.items():
-        for keyword in keywords:
-            if keyword in full_text:
-                matched_tags.add(tag_id)
-                break
-    
-    # Second pass: Check for related content if we haven't found any tags yet
-    if not matched_tags:
-        # Check for outdoor vs indoor
-        if any(word in full_text for word in ['park', 'garden', 'outside', 'outdoors', 'nature']):
-            matched_tags.add(13)  # Outdoor
-        elif any(word in full_text for word in ['hall', 'theater', 'venue', 'center', 'inside']):
-            matched_tags.add(14)  # Indoor
-            
-        # Check for event type based on common patterns
-        if any(word in full_text for word in ['music', 'song', 'audio', 'listen']):
-            matched_tags.add(1)  # Live Music
-        
-        if any(word in full_text for word in ['laugh', 'joke', 'funny']):
-            matched_tags.add(3)  # Comedy
-            
-        if any(word in full_text for word in ['workshop', 'learn', 'education', 'knowledge']):
-            matched_tags.add(11)  # Educational
-    
-    # Apply heuristics for common combinations
-    if 1 in matched_tags and 20 not in matched_tags:
-        # If we have live music but not concert, add concert
-        matched_tags.add(20)
-        
-    if 18 in matched_tags or 19 in matched_tags:
-        # Yoga or Meditation suggests Health & Wellness
-        matched_tags.add(17)
-        
-    # If event has only Indoor or Outdoor tag, try to infer at least one content tag
-    if matched_tags == {13} or matched_tags == {14} or not matched_tags:
-        # Look for any words that might indicate the type of event
-        if any(word in full_text for word in ['music', 'band', 'concert', 'performance']):
-            matched_tags.add(1)  # Live Music
-        elif any(word in full_text for word in ['art', 'gallery', 'exhibition']):
-            matched_tags.add(7)  # Art Exhibition
-        elif any(word in full_text for word in ['learn', 'education', 'workshop']):
-            matched_tags.add(11)  # Educational
-    
-    return list(matched_tags)
-
-def enhance_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Enhance a single event with additional data.
-    
-    Args:
-        event: Original event dictionary
-        
-    Returns:
-        Enhanced event dictionary
-    """
-    # Make a copy to avoid modifying the original
-    enhanced = event.copy()
-    
-    # 1. Format name/title field
-    if 'title' in enhanced and not enhanced.get('name'):
-        enhanced['name'] = enhanced.pop('title')
-    
-    # 2. Format dates and times
-    enhanced = format_dates_and_times(enhanced)
-    
-    # 3. Get location details
-    venue_location = enhanced.get('venue', '')
-    city = enhanced.get('city', '')
-    state = enhanced.get('state', '')
-    
-    # Build location query based on available information
-    if venue_location and (city or state):
-        location_query = f"{venue_location}, {city}, {state}".strip(", ")
-    elif venue_location:
-        location_query = venue_location
-    elif city and state:
-        location_query = f"{city}, {state}"
-    else:
-        location_query = enhanced.get('location', '')
-    
-    # Get location details from Google API
-    location_data = {}
-    if location_query:
-        location_data = get_location_details(location_query)
-        
-        # Update with location details if found
-        if location_data['city']:
-            enhanced['city'] = location_data['city']
-        if location_data['state']:
-            enhanced['state'] = location_data['state']
-        if location_data['country']:
-            enhanced['country'] = location_data['country']
-        if location_data['district']:
-            enhanced['district'] = location_data['district']
-        if location_data['lat'] is not None:
-            enhanced['lat'] = location_data['lat']
-        if location_data['lng'] is not None:
-            enhanced['lng'] = location_data['lng']
-    
-    # 4. Set default country if still missing
-    if not enhanced.get('country'):
-        enhanced['country'] = 'United States'
-    
-    # 5. Add or update address field with full venue address
-    address = get_event_address(enhanced, location_data)
-    if address:
-        enhanced['address'] = address
-    
-    # 6. Infer tags based on event content
-    tag_ids = infer_event_tags(enhanced)
-    if tag_ids:
-        enhanced['tag_ids'] = tag_ids
-    
-    return enhanced
-
-def enhance_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Enhance a list of events with additional data.
-    
-    Args:
-        events: List of event dictionaries
-        
-    Returns:
-        List of enhanced event dictionaries
-    """
-    if not events:
-        logger.warning("No events to enhance")
-        return events
-    
-    logger.info(f"Enhancing {len(events)} events with additional data")
-    enhanced_events = []
-    
-    for i, event in enumerate(events):
-        logger.info(f"Enhancing event {i+1}/{len(events)}: {event.get('name', event.get('title', 'Unnamed event'))}")
-        enhanced_event = enhance_event(event)
-        enhanced_events.append(enhanced_event)
-    
-    logger.info("Finished enhancing all events")
-    return enhanced_events
-
-# Example usage if run directly
-if __name__ == "__main__":
-    # Test with a few sample events
-    sample_events = [
-        {
-            "title": "WSRE Wine & Food Classic",
-            "date": "March 29, 2025, 7 PM - 10 PM",
-            "venue": "WSRE Jean & Paul Amos Performance Studio",
-            "description": "A celebration of regional flavors featuring fine wines and gourmet dishes."
-        },
-        {
-            "title": "Pensacola Symphony Orchestra Presents Strauss & Schubert",
-            "date": "March 29, 2025, 7:30 PM - 9:30 PM",
-            "venue": "Saenger Theatre, Pensacola",
-            "description": "Experience Richard Strauss' Oboe Concerto performed by Titus Underwood, along with Strauss' Serenade for Winds and Schubert's Ninth Symphony, 'The Great.'"
-        }
-    ]
-    
-    # Enhance the sample events
-    enhanced_events = enhance_events(sample_events)
-    
-    # Print the results
-    import json
-    for event in enhanced_events:
-        print(json.dumps(event, indent=2))
+# EventDataEnhancer.py
+
+import os
+import asyncio
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import bisect
+import calendar
+import functools
+import json
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+import re
+import time
+from datetime import datetime
+
+# Optional: orjson parses the geocode payloads several times faster than
+# stdlib json and works on raw bytes, skipping requests' charset decode
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('EventDataEnhancer')
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for standalone use of this module.
+
+    Importers (the pipeline scripts) configure logging themselves, so this
+    is opt-in rather than a side effect of import.
+
+    Args:
+        level: Logging level for the root logger
+    """
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# API Configuration
+GOOGLE_PLACES_API_KEY = os.environ.get("GOOGLE_PLACES_API_KEY")
+
+# Log warning if API key is missing
+if not GOOGLE_PLACES_API_KEY:
+    logger.warning("GOOGLE_PLACES_API_KEY environment variable is not set. Location enhancement will be limited.")
+
+# Geocoding cache configuration
+GEO_CACHE_FILE = os.environ.get("GEO_CACHE_FILE", "geocode_cache.db")
+GEO_CACHE_TTL_SECONDS = 180 * 24 * 3600  # Entries older than ~180 days are skipped on load
+
+# Geocoding API endpoint and concurrency limits
+GEOCODE_ENDPOINT = "https://maps.googleapis.com/maps/api/geocode/json"
+GEOCODE_MAX_CONCURRENCY = 5  # Stay under Google's per-second limits
+GEOCODE_CONNECTION_LIMIT = 8
+GEOCODE_MAX_WORKERS = 8  # Thread pool size for the synchronous batch path
+GEOCODE_MAX_ATTEMPTS = 5  # Application-level retries on quota/transient statuses
+GEOCODE_MAX_BACKOFF = 8  # Seconds; exponential backoff is capped here
+
+# Geocoding statuses worth retrying with backoff (quota or transient errors)
+_RETRYABLE_GEOCODE_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+# Shared session for synchronous geocode calls: keep-alive avoids paying a
+# full TCP+TLS handshake against maps.googleapis.com for every event.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# In-memory geocoding cache, keyed by normalized query string.
+# Loaded from the persistent store at import time so repeat lookups are pure dict hits.
+_GEO_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# US state names -> postal abbreviations, for cache-key canonicalization
+_STATE_ABBREVIATIONS = {
+    'alabama': 'al', 'alaska': 'ak', 'arizona': 'az', 'arkansas': 'ar',
+    'california': 'ca', 'colorado': 'co', 'connecticut': 'ct', 'delaware': 'de',
+    'florida': 'fl', 'georgia': 'ga', 'hawaii': 'hi', 'idaho': 'id',
+    'illinois': 'il', 'indiana': 'in', 'iowa': 'ia', 'kansas': 'ks',
+    'kentucky': 'ky', 'louisiana': 'la', 'maine': 'me', 'maryland': 'md',
+    'massachusetts': 'ma', 'michigan': 'mi', 'minnesota': 'mn', 'mississippi': 'ms',
+    'missouri': 'mo', 'montana': 'mt', 'nebraska': 'ne', 'nevada': 'nv',
+    'new hampshire': 'nh', 'new jersey': 'nj', 'new mexico': 'nm', 'new york': 'ny',
+    'north carolina': 'nc', 'north dakota': 'nd', 'ohio': 'oh', 'oklahoma': 'ok',
+    'oregon': 'or', 'pennsylvania': 'pa', 'rhode island': 'ri', 'south carolina': 'sc',
+    'south dakota': 'sd', 'tennessee': 'tn', 'texas': 'tx', 'utah': 'ut',
+    'vermont': 'vt', 'virginia': 'va', 'washington': 'wa', 'west virginia': 'wv',
+    'wisconsin': 'wi', 'wyoming': 'wy', 'district of columbia': 'dc'
+}
+
+# Strip everything except word characters, whitespace and the commas that
+# separate query components
+_PUNCT_RE = re.compile(r"[^\w\s,]")
+
+def normalize_location_query(location_query: str) -> str:
+    """
+    Normalize a location query for cache lookups.
+
+    Lowercases, strips punctuation, collapses whitespace, and canonicalizes
+    spelled-out US state names to their abbreviations so "Pensacola, Florida"
+    and "pensacola, FL" share a cache entry.
+
+    Args:
+        location_query: Raw location query string
+
+    Returns:
+        Canonical cache key for the query
+    """
+    normalized = _PUNCT_RE.sub('', location_query.strip().lower())
+    normalized = re.sub(r'\s+', ' ', normalized)
+    components = [component.strip() for component in normalized.split(',')]
+    components = [_STATE_ABBREVIATIONS.get(component, component) for component in components]
+    return ', '.join(component for component in components if component)
+
+def _geo_cache_connect() -> sqlite3.Connection:
+    """Open the cache database, creating the table on first use."""
+    conn = sqlite3.connect(GEO_CACHE_FILE)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, payload TEXT, ts INTEGER)")
+    return conn
+
+def _load_geo_cache() -> None:
+    """Load persisted geocoding results into the in-memory cache."""
+    try:
+        cutoff = int(datetime.now().timestamp()) - GEO_CACHE_TTL_SECONDS
+        with _geo_cache_connect() as conn:
+            for key, payload in conn.execute("SELECT key, payload FROM cache WHERE ts >= ?", (cutoff,)):
+                _GEO_CACHE[key] = json.loads(payload)
+        if _GEO_CACHE:
+            logger.info(f"Loaded {len(_GEO_CACHE)} cached geocoding results from {GEO_CACHE_FILE}")
+    except Exception as e:
+        logger.warning(f"Could not load geocoding cache from {GEO_CACHE_FILE}: {str(e)}")
+
+def _store_geo_cache(cache_key: str, location_data: Dict[str, Any]) -> None:
+    """Store a successful geocoding result in memory and on disk."""
+    _GEO_CACHE[cache_key] = location_data
+    try:
+        # A short-lived connection keeps this safe from worker threads
+        with _geo_cache_connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache (key, payload, ts) VALUES (?, ?, ?)",
+                         (cache_key, json.dumps(location_data), int(datetime.now().timestamp())))
+    except Exception as e:
+        logger.warning(f"Could not persist geocoding result to {GEO_CACHE_FILE}: {str(e)}")
+
+# Warm the cache once at import time
+_load_geo_cache()
+
+# Pattern for trivially parseable "City, ST" queries that need no API round-trip
+_CITY_STATE_RE = re.compile(r"^\s*([A-Za-z .'-]+),\s*([A-Z]{2})\s*$")
+
+def _resolve_city_state_locally(location_query: str, location_data: Dict[str, Any]) -> bool:
+    """
+    Resolve a pure "City, ST" query locally, without the Geocoding API.
+
+    Only the coarse taxonomy fields (city, state code) can be filled this
+    way; coordinates and the formatted address stay unset.
+
+    Args:
+        location_query: Location query string
+        location_data: Dictionary to populate in place
+
+    Returns:
+        True if the query matched the City, ST pattern, False otherwise
+    """
+    match = _CITY_STATE_RE.match(location_query)
+    if not match:
+        return False
+
+    location_data["city"] = match.group(1).strip()
+    location_data["state"] = match.group(2)
+    location_data["state_code"] = match.group(2)
+    logger.debug(f"Resolved '{location_query}' locally without an API call")
+    return True
+
+def _default_location_data() -> Dict[str, Any]:
+    """Build the default location details dictionary."""
+    return {
+        "city": "",
+        "state": "",
+        "country": "",
+        "district": "",
+        "lat": None,
+        "lng": None,
+        "formatted_address": ""  # Add formatted_address field for full venue address
+    }
+
+def _parse_geocode_payload(data: Dict[str, Any], location_query: str, location_data: Dict[str, Any]) -> bool:
+    """
+    Fill location_data from a Geocoding API response payload.
+
+    Args:
+        data: Parsed JSON payload from the Geocoding API
+        location_query: Original query string, for logging
+        location_data: Dictionary to populate in place
+
+    Returns:
+        True if the payload contained a usable result, False otherwise
+    """
+    # Check if the request was successful
+    if data["status"] == "OK" and len(data["results"]) > 0:
+        # Get the first result
+        result = data["results"][0]
+
+        # Store the formatted address
+        location_data["formatted_address"] = result.get("formatted_address", "")
+
+        # Extract coordinates
+        location = result["geometry"]["location"]
+        location_data["lat"] = location["lat"]
+        location_data["lng"] = location["lng"]
+
+        # Extract address components
+        address_components = result["address_components"]
+
+        for component in address_components:
+            # City (locality)
+            if "locality" in component["types"]:
+                location_data["city"] = component["long_name"]
+
+            # District (administrative_area_level_2)
+            elif "administrative_area_level_2" in component["types"]:
+                location_data["district"] = component["long_name"]
+
+            # State (administrative_area_level_1)
+            elif "administrative_area_level_1" in component["types"]:
+                location_data["state"] = component["long_name"]
+                # Also store the state code (e.g., "FL")
+                location_data["state_code"] = component["short_name"]
+
+            # Country
+            elif "country" in component["types"]:
+                location_data["country"] = component["long_name"]
+                # Also store the country code (e.g., "US")
+                location_data["country_code"] = component["short_name"]
+
+        logger.info(f"Found location details for '{location_query}': {location_data['city']}, {location_data['state']}")
+        if location_data["formatted_address"]:
+            logger.info(f"Found address: {location_data['formatted_address']}")
+        return True
+    else:
+        logger.warning(f"Could not find location details for '{location_query}': {data['status']}")
+        return False
+
+def get_location_details(location_query: str, require_coordinates: bool = True) -> Dict[str, Any]:
+    """
+    Get detailed location information from Google Places API using a query string.
+
+    Args:
+        location_query: Location query string (e.g., "Pensacola, FL" or "Saenger Theatre, Pensacola")
+        require_coordinates: When False, pure "City, ST" queries are resolved
+            locally and the API call is skipped entirely
+
+    Returns:
+        Dictionary containing location details (city, state, country, district, lat, lng, formatted_address)
+    """
+    # Initialize the result dictionary with default values
+    location_data = _default_location_data()
+
+    if not location_query:
+        logger.warning("Empty location query provided")
+        return location_data
+
+    # Check the cache before going to the network (or requiring an API key)
+    cache_key = normalize_location_query(location_query)
+    if cache_key in _GEO_CACHE:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Geocoding cache hit for '{location_query}'")
+        return dict(_GEO_CACHE[cache_key])
+
+    # Skip the round-trip entirely when only taxonomy fields are needed
+    if not require_coordinates and _resolve_city_state_locally(location_query, location_data):
+        return location_data
+
+    if not GOOGLE_PLACES_API_KEY:
+        logger.error("GOOGLE_PLACES_API_KEY is not set. Cannot fetch location details.")
+        return location_data
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Getting location details for: '{location_query}'")
+
+    # Parameters for the API request
+    params = {
+        "address": location_query,
+        "key": GOOGLE_PLACES_API_KEY
+    }
+
+    try:
+        for attempt in range(GEOCODE_MAX_ATTEMPTS):
+            # Make the API request over the shared keep-alive session
+            response = _SESSION.get(GEOCODE_ENDPOINT, params=params, timeout=(3, 10))
+            response.raise_for_status()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+
+            # Back off on quota/transient statuses instead of failing the event
+            status = data.get("status", "")
+            if status in _RETRYABLE_GEOCODE_STATUSES and attempt < GEOCODE_MAX_ATTEMPTS - 1:
+                delay = min(2 ** attempt, GEOCODE_MAX_BACKOFF)
+                logger.warning(f"Geocoding returned {status} for '{location_query}', retrying in {delay}s")
+                time.sleep(delay)
+                continue
+
+            # Only cache definitive outcomes (OK / ZERO_RESULTS), never
+            # transient failures that could poison the cache
+            if _parse_geocode_payload(data, location_query, location_data) or status == "ZERO_RESULTS":
+                _store_geo_cache(cache_key, dict(location_data))
+            break
+
+    except Exception as e:
+        logger.error(f"Error getting location details for '{location_query}': {str(e)}")
+
+    return location_data
+
+async def _get_location_details_async(session: aiohttp.ClientSession, location_query: str,
+                                      require_coordinates: bool = True) -> Dict[str, Any]:
+    """
+    Async variant of get_location_details using a shared aiohttp session.
+
+    Args:
+        session: Shared aiohttp client session
+        location_query: Location query string
+        require_coordinates: When False, pure "City, ST" queries are resolved
+            locally and the API call is skipped entirely
+
+    Returns:
+        Dictionary containing location details (same shape as get_location_details)
+    """
+    location_data = _default_location_data()
+
+    if not location_query:
+        logger.warning("Empty location query provided")
+        return location_data
+
+    # Check the cache before going to the network (or requiring an API key)
+    cache_key = normalize_location_query(location_query)
+    if cache_key in _GEO_CACHE:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Geocoding cache hit for '{location_query}'")
+        return dict(_GEO_CACHE[cache_key])
+
+    # Skip the round-trip entirely when only taxonomy fields are needed
+    if not require_coordinates and _resolve_city_state_locally(location_query, location_data):
+        return location_data
+
+    if not GOOGLE_PLACES_API_KEY:
+        logger.error("GOOGLE_PLACES_API_KEY is not set. Cannot fetch location details.")
+        return location_data
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Getting location details for: '{location_query}'")
+
+    params = {
+        "address": location_query,
+        "key": GOOGLE_PLACES_API_KEY
+    }
+
+    try:
+        for attempt in range(GEOCODE_MAX_ATTEMPTS):
+            async with session.get(GEOCODE_ENDPOINT, params=params) as response:
+                response.raise_for_status()
+                body = await response.read()
+            data = orjson.loads(body) if orjson is not None else json.loads(body)
+
+            # Back off on quota/transient statuses instead of failing the event
+            status = data.get("status", "")
+            if status in _RETRYABLE_GEOCODE_STATUSES and attempt < GEOCODE_MAX_ATTEMPTS - 1:
+                delay = min(2 ** attempt, GEOCODE_MAX_BACKOFF)
+                logger.warning(f"Geocoding returned {status} for '{location_query}', retrying in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+
+            # Only cache definitive outcomes (OK / ZERO_RESULTS), never
+            # transient failures that could poison the cache
+            if _parse_geocode_payload(data, location_query, location_data) or status == "ZERO_RESULTS":
+                _store_geo_cache(cache_key, dict(location_data))
+            break
+
+    except Exception as e:
+        logger.error(f"Error getting location details for '{location_query}': {str(e)}")
+
+    return location_data
+
+# Precompiled date/time patterns for format_dates_and_times (per-event hot path)
+_DATE_PATTERNS = [
+    (re.compile(r'(\d{4}-\d{2}-\d{2})'), 'iso'),              # YYYY-MM-DD
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), 'us'),       # MM/DD/YYYY
+    (re.compile(r'([A-Za-z]+) (\d{1,2}), (\d{4})'), 'long')   # Month DD, YYYY
+]
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})(?:\s*)(AM|PM)?', re.IGNORECASE)
+
+# Month-name lookup (full and abbreviated) to sidestep strptime's tokenizer
+# and locale handling for the common "March 29, 2025" shape
+_MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_abbr) if name})
+
+def format_dates_and_times(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format and validate date and time fields in an event.
+    
+    Args:
+        event: Event dictionary
+        
+    Returns:
+        Event with formatted date and time fields
+    """
+    # Default values
+    today = datetime.now().strftime('%Y-%m-%d')
+    default_start_time = "18:00:00"
+    default_end_time = "23:59:59"
+    
+    # Ensure start_date exists
+    if not event.get('start_date'):
+        # Try to extract from date field if it exists
+        if event.get('date'):
+            # Try the precompiled date patterns in order
+            for pattern, kind in _DATE_PATTERNS:
+                match = pattern.search(event['date'])
+                if match:
+                    # Found a date match, try to parse it
+                    try:
+                        if kind == 'iso':  # YYYY-MM-DD
+                            event['start_date'] = match.group(1)
+                        elif kind == 'us':  # MM/DD/YYYY
+                            month, day, year = match.groups()
+                            event['start_date'] = f"{year}-{int(month):02d}-{int(day):02d}"
+                        else:  # Month DD, YYYY
+                            month = _MONTHS.get(match.group(1).lower())
+                            if month is None:
+                                continue
+                            event['start_date'] = f"{match.group(3)}-{month:02d}-{int(match.group(2)):02d}"
+                        break
+                    except (ValueError, IndexError):
+                        continue
+        
+        # If still no start_date, use today
+        if not event.get('start_date'):
+            event['start_date'] = today
+    
+    # Ensure end_date exists
+    if not event.get('end_date'):
+        event['end_date'] = event['start_date']
+    
+    # Ensure start_time exists
+    if not event.get('start_time'):
+        # Try to extract from date field if it exists
+        if event.get('date'):
+            # Try to find time
+            match = _TIME_RE.search(event.get('date', ''))
+            if match:
+                hour = int(match.group(1))
+                minute = match.group(2)
+                am_pm = match.group(3)
+                
+                # Handle AM/PM
+                if am_pm and am_pm.upper() == 'PM' and hour < 12:
+                    hour += 12
+                elif am_pm and am_pm.upper() == 'AM' and hour == 12:
+                    hour = 0
+                
+                event['start_time'] = f"{hour:02}:{minute}:00"
+            else:
+                event['start_time'] = default_start_time
+        else:
+            event['start_time'] = default_start_time
+    
+    # Ensure end_time exists
+    if not event.get('end_time'):
+        event['end_time'] = default_end_time
+    
+    return event
+
+def get_event_address(event: Dict[str, Any], location_data: Dict[str, Any]) -> str:
+    """
+    Format a full address for the event based on available data.
+    
+    Args:
+        event: Event dictionary
+        location_data: Location data from Google API
+        
+    Returns:
+        Formatted address string
+    """
+    # If we have a formatted address from the API, use it
+    if location_data.get('formatted_address'):
+        return location_data['formatted_address']
+    
+    # Otherwise, try to build a reasonable address from venue and location
+    venue = event.get('venue', '')
+    city = event.get('city', location_data.get('city', ''))
+    state = event.get('state', location_data.get('state', ''))
+    country = event.get('country', location_data.get('country', ''))
+    
+    # Construct address components
+    address_parts = []
+    
+    if venue:
+        address_parts.append(venue)
+    
+    location_part = ", ".join(p for p in [city, state] if p)
+    if location_part:
+        address_parts.append(location_part)
+    
+    if country and country != "United States":  # Only add country if not US (common convention)
+        address_parts.append(country)
+    
+    if not address_parts:
+        return ""
+    
+    return ", ".join(address_parts)
+
+
+
+from typing import Dict, Any, List
+
+# Optional: pyahocorasick gives a single-pass C-level scan over all keywords
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Tag categories and associated keywords using the correct tag IDs
+TAG_CATEGORIES = {
+# Live Music (ID: 1)
+    1: ['live music', 'concert', 'musician', 'band', 'performance', 'singer', 'gig'],
+    
+    # Nightlife (ID: 2)
+    2: ['nightlife', 'club', 'bar', 'pub', 'party', 'nightclub', 'disco', 'DJ'],
+    
+    # Comedy (ID: 3)
+    3: ['comedy', 'comedian', 'stand-up', 'improv', 'humorous', 'funny', 'laugh'],
+    
+    # Family-Friendly (ID: 4)
+    4: ['family', 'kids', 'children', 'child', 'youth', 'family-friendly', 'all ages'],
+    
+    # Food Festival (ID: 5)
+    5: ['food', 'culinary', 'cuisine', 'tasting', 'dining', 'restaurant', 'chef', 'wine', 'beer'],
+    
+    # Sports (ID: 6)
+    6: ['sports', 'game', 'match', 'tournament', 'athletics', 'competition', 'team', 'league'],
+    
+    # Art Exhibition (ID: 7)
+    7: ['art', 'gallery', 'exhibition', 'museum', 'artist', 'painting', 'sculpture'],
+    
+    # Networking (ID: 8)
+    8: ['network', 'networking', 'social', 'meetup', 'mixer', 'professional', 'business', 'entrepreneur'],
+    
+    # Tech Meetup (ID: 9)
+    9: ['tech', 'technology', 'coding', 'programming', 'developer', 'software', 'hardware', 'startup', 'innovation'],
+    
+    # Charity Event (ID: 10)
+    10: ['charity', 'fundraiser', 'nonprofit', 'donation', 'cause', 'benefit', 'volunteer'],
+    
+    # Educational (ID: 11)
+    11: ['education', 'learning', 'workshop', 'class', 'seminar', 'lecture', 'training', 'conference'],
+    
+    # Dance Party (ID: 12)
+    12: ['dance', 'dancing', 'choreography', 'ballroom', 'salsa', 'hip-hop', 'ballet'],
+    
+    # Outdoor (ID: 13)
+    13: ['outdoor', 'outside', 'park', 'nature', 'garden', 'field', 'yard', 'plaza'],
+    
+    # Indoor (ID: In: 14)
+    14: ['indoor', 'inside', 'venue', 'hall', 'center', 'building', 'auditorium'],
+    
+    # Virtual Event (ID: 15)
+    15: ['virtual', 'online', 'digital', 'remote', 'zoom', 'stream', 'webinar'],
+    
+    # Gaming Tournament (ID: 16)
+    16: ['gaming', 'game', 'tournament', 'esports', 'video game', 'console', 'competition'],
+    
+    # Health & Wellness (ID: 17)
+    17: ['health', 'wellness', 'fitness', 'well-being', 'mindfulness', 'self-care', 'spa', 'retreat'],
+    
+    # Yoga (ID: 18)
+    18: ['yoga', 'meditation', 'mindfulness', 'stretching', 'poses', 'asana'],
+    
+    # Meditation (ID: 19)
+    19: ['meditation', 'mindfulness', 'relaxation', 'spiritual', 'zen', 'calm', 'peace'],
+    
+    # Concert (ID: 20)
+    20: ['concert', 'symphony', 'orchestra', 'philharmonic', 'recital', 'show', 'musical'],
+    
+    # Theater (ID: 21)
+    21: ['theater', 'theatre', 'play', 'drama', 'performance', 'stage', 'acting', 'broadway']
+}
+
+# Keyword -> tag IDs, inverted once from TAG_CATEGORIES at import time.
+# Matching stays substring-based ("concerts", "workshops" and other
+# inflected forms still hit their keywords), same as the original
+# per-category loops.
+_KEYWORD_TAGS: Dict[str, set] = {}
+for _tag_id, _keywords in TAG_CATEGORIES.items():
+    for _keyword in _keywords:
+        # Keywords are compared verbatim against lowercased text, as the
+        # original loops did ('DJ' has therefore never actually matched)
+        _KEYWORD_TAGS.setdefault(_keyword, set()).add(_tag_id)
+
+# Hint alternations for the second-pass heuristics, shared between the
+# per-event and batch paths. One compiled substring search per group
+# replaces a fresh `in` scan per hint word.
+_OUTDOOR_HINTS_RE = re.compile('park|garden|outside|outdoors|nature')
+_INDOOR_HINTS_RE = re.compile('hall|theater|venue|center|inside')
+_MUSIC_HINTS_RE = re.compile('music|song|audio|listen')
+_COMEDY_HINTS_RE = re.compile('laugh|joke|funny')
+_EDUCATIONAL_HINTS_RE = re.compile('workshop|learn|education|knowledge')
+_PERFORMANCE_HINTS_RE = re.compile('music|band|concert|performance')
+_ART_HINTS_RE = re.compile('art|gallery|exhibition')
+
+if ahocorasick is not None:
+    # One linear pass over the text emits every matching keyword at once.
+    # iter() reports every word ending at each position, so nested and
+    # overlapping keywords ("music" inside "musical") all surface, exactly
+    # like the per-keyword `in` checks they replace.
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _tags in _KEYWORD_TAGS.items():
+        _KEYWORD_AUTOMATON.add_word(_keyword, _tags)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+def _match_keyword_tags(full_text: str) -> set:
+    """
+    Scan lowercased text and return all tag IDs whose keywords appear.
+
+    Keywords match as substrings, so inflected forms ("concerts",
+    "workshops") count. With pyahocorasick the whole catalog is found in
+    one pass; the fallback runs one C-level substring check per keyword.
+
+    Args:
+        full_text: Lowercased text to scan
+
+    Returns:
+        Set of matching tag IDs
+    """
+    matched_tags = set()
+    if _KEYWORD_AUTOMATON is not None:
+        for _, tags in _KEYWORD_AUTOMATON.iter(full_text):
+            matched_tags.update(tags)
+    else:
+        for keyword, tags in _KEYWORD_TAGS.items():
+            if keyword in full_text:
+                matched_tags.update(tags)
+    return matched_tags
+
+def _apply_tag_heuristics(matched_tags: set, full_text: str) -> set:
+    """
+    Apply the second-pass and combination heuristics to a matched-tag set.
+
+    Args:
+        matched_tags: Tag IDs found by the keyword scan (mutated in place)
+        full_text: Lowercased text of the event
+
+    Returns:
+        The heuristically augmented tag set
+    """
+    # Second pass: Check for related content if we haven't found any tags yet
+    if not matched_tags:
+        # Check for outdoor vs indoor
+        if _OUTDOOR_HINTS_RE.search(full_text):
+            matched_tags.add(13)  # Outdoor
+        elif _INDOOR_HINTS_RE.search(full_text):
+            matched_tags.add(14)  # Indoor
+
+        # Check for event type based on common patterns
+        if _MUSIC_HINTS_RE.search(full_text):
+            matched_tags.add(1)  # Live Music
+
+        if _COMEDY_HINTS_RE.search(full_text):
+            matched_tags.add(3)  # Comedy
+
+        if _EDUCATIONAL_HINTS_RE.search(full_text):
+            matched_tags.add(11)  # Educational
+
+    # Apply heuristics for common combinations
+    if 1 in matched_tags and 20 not in matched_tags:
+        # If we have live music but not concert, add concert
+        matched_tags.add(20)
+
+    if 18 in matched_tags or 19 in matched_tags:
+        # Yoga or Meditation suggests Health & Wellness
+        matched_tags.add(17)
+
+    # If event has only Indoor or Outdoor tag, try to infer at least one content tag
+    if matched_tags == {13} or matched_tags == {14} or not matched_tags:
+        # Look for any words that might indicate the type of event
+        if _PERFORMANCE_HINTS_RE.search(full_text):
+            matched_tags.add(1)  # Live Music
+        elif _ART_HINTS_RE.search(full_text):
+            matched_tags.add(7)  # Art Exhibition
+        elif _EDUCATIONAL_HINTS_RE.search(full_text):
+            matched_tags.add(11)  # Educational
+
+    return matched_tags
+
+@functools.lru_cache(maxsize=8192)
+def _infer_tags_cached(full_text: str) -> tuple:
+    """
+    Infer tag IDs from pre-built lowercased event text.
+
+    Memoized: re-enhanced events (retries, dedup pipelines, incremental
+    syncs) with identical text cost a single cache lookup.
+
+    Args:
+        full_text: Lowercased "title description venue" text
+
+    Returns:
+        Tuple of tag IDs (hashable for the cache)
+    """
+    # First pass: scan the text for all catalog keywords
+    matched_tags = _match_keyword_tags(full_text)
+    return tuple(_apply_tag_heuristics(matched_tags, full_text))
+
+def _build_full_text(event: Dict[str, Any]) -> str:
+    """Build the lowercased text blob tag inference scans for an event."""
+    title = event.get('name') or event.get('title') or ''
+    description = event.get('description') or ''
+    venue = event.get('venue') or event.get('address') or ''
+    # One join and one lowercase pass instead of three .lower() calls and
+    # the f-string's intermediate allocations
+    return ' '.join((title, description, venue)).lower()
+
+def infer_event_tags(event: Dict[str, Any]) -> List[int]:
+    """
+    Infer event tags based on description and title.
+
+    Args:
+        event: Event dictionary
+
+    Returns:
+        List of tag IDs
+    """
+    return list(_infer_tags_cached(_build_full_text(event)))
+
+def infer_event_tags_batch(events: List[Dict[str, Any]]) -> List[List[int]]:
+    """
+    Infer tags for a whole batch of events in a single keyword pass.
+
+    With pyahocorasick the events' texts are joined with a NUL sentinel
+    and scanned once by the same automaton the per-event path uses,
+    amortizing scan setup; matches are attributed back to events by
+    offset. Without it, each text goes through _match_keyword_tags
+    directly. Either way the matching semantics are identical to
+    infer_event_tags, and the heuristic post-processing runs per event.
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        List of tag ID lists, parallel to the input
+    """
+    if not events:
+        return []
+
+    full_texts = [_build_full_text(event) for event in events]
+
+    if _KEYWORD_AUTOMATON is None:
+        matched = [_match_keyword_tags(text) for text in full_texts]
+    else:
+        corpus = '\0'.join(full_texts)
+
+        # Start offset of each event's text within the corpus
+        starts = []
+        offset = 0
+        for text in full_texts:
+            starts.append(offset)
+            offset += len(text) + 1  # account for the sentinel
+
+        matched = [set() for _ in full_texts]
+        # No keyword contains NUL, so a match never spans two events and
+        # its end offset always lands inside the right one
+        for end_index, tags in _KEYWORD_AUTOMATON.iter(corpus):
+            matched[bisect.bisect_right(starts, end_index) - 1].update(tags)
+
+    return [list(_apply_tag_heuristics(tags, text))
+            for tags, text in zip(matched, full_texts)]
+
+def _prepare_event(event: Dict[str, Any], copy: bool = False) -> Dict[str, Any]:
+    """
+    Run the cheap, local (non-I/O) enhancement steps for an event.
+
+    Mutates the event in place by default — callers treat the returned
+    dictionary as the canonical event, so the per-event shallow copy was
+    pure allocation and GC pressure. Pass copy=True to preserve the
+    caller's dictionary.
+
+    Args:
+        event: Original event dictionary
+        copy: Copy the event instead of mutating it in place
+
+    Returns:
+        Event with name and date/time fields normalized
+    """
+    enhanced = {**event} if copy else event
+
+    # 1. Format name/title field
+    if 'title' in enhanced and not enhanced.get('name'):
+        enhanced['name'] = enhanced.pop('title')
+
+    # 2. Format dates and times
+    enhanced = format_dates_and_times(enhanced)
+
+    return enhanced
+
+def build_location_query(event: Dict[str, Any]) -> str:
+    """
+    Build the geocoding query string for an event from its location fields.
+
+    Args:
+        event: Event dictionary
+
+    Returns:
+        Query string for the Geocoding API, or empty string if no location info
+    """
+    # Join the non-empty components once; fall back to the raw location
+    parts = [p for p in (event.get('venue'), event.get('city'), event.get('state')) if p]
+    return ", ".join(parts) or event.get('location', '')
+
+def _finalize_event(enhanced: Dict[str, Any], location_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge location details into an event and run the remaining local steps.
+
+    Args:
+        enhanced: Event dictionary prepared by _prepare_event
+        location_data: Location details from the Geocoding API (may be empty)
+
+    Returns:
+        Fully enhanced event dictionary
+    """
+    if location_data:
+        # Update with location details if found
+        if location_data['city']:
+            enhanced['city'] = location_data['city']
+        if location_data['state']:
+            enhanced['state'] = location_data['state']
+        if location_data['country']:
+            enhanced['country'] = location_data['country']
+        if location_data['district']:
+            enhanced['district'] = location_data['district']
+        if location_data['lat'] is not None:
+            enhanced['lat'] = location_data['lat']
+        if location_data['lng'] is not None:
+            enhanced['lng'] = location_data['lng']
+
+    # Set default country if still missing
+    if not enhanced.get('country'):
+        enhanced['country'] = 'United States'
+
+    # Add or update address field with full venue address
+    address = get_event_address(enhanced, location_data)
+    if address:
+        enhanced['address'] = address
+
+    # Infer tags based on event content
+    tag_ids = infer_event_tags(enhanced)
+    if tag_ids:
+        enhanced['tag_ids'] = tag_ids
+
+    return enhanced
+
+def enhance_event(event: Dict[str, Any], require_coordinates: bool = True) -> Dict[str, Any]:
+    """
+    Enhance a single event with additional data.
+
+    Args:
+        event: Original event dictionary
+        require_coordinates: Pass False for pipelines that only need address
+            taxonomy; trivially parseable queries then skip the API call
+
+    Returns:
+        Enhanced event dictionary
+    """
+    enhanced = _prepare_event(event)
+
+    # Get location details from Google API
+    location_query = build_location_query(enhanced)
+    location_data = get_location_details(location_query, require_coordinates) if location_query else {}
+
+    return _finalize_event(enhanced, location_data)
+
+async def enhance_event_async(session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                              event: Dict[str, Any], require_coordinates: bool = True) -> Dict[str, Any]:
+    """
+    Enhance a single event, performing the geocode lookup asynchronously.
+
+    The pure-CPU steps (date formatting, tag inference) run synchronously
+    inside the coroutine; only the network call is awaited.
+
+    Args:
+        session: Shared aiohttp client session
+        sem: Semaphore bounding concurrent geocode requests
+        event: Original event dictionary
+        require_coordinates: Pass False for pipelines that only need address
+            taxonomy; trivially parseable queries then skip the API call
+
+    Returns:
+        Enhanced event dictionary
+    """
+    enhanced = _prepare_event(event)
+
+    location_query = build_location_query(enhanced)
+    location_data = {}
+    if location_query:
+        async with sem:
+            location_data = await _get_location_details_async(session, location_query, require_coordinates)
+
+    return _finalize_event(enhanced, location_data)
+
+def _resolve_queries_offline(queries) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve location queries without the Geocoding API (no key configured).
+
+    Uses the persistent cache and the local "City, ST" parser only, so a
+    keyless run pays zero network calls and logs a single warning instead
+    of one error per event.
+
+    Args:
+        queries: Iterable of location query strings
+
+    Returns:
+        Dictionary mapping each query to its (possibly empty) location data
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for query in queries:
+        cached = _GEO_CACHE.get(normalize_location_query(query))
+        if cached is not None:
+            results[query] = dict(cached)
+            continue
+        location_data = _default_location_data()
+        _resolve_city_state_locally(query, location_data)
+        results[query] = location_data
+    return results
+
+async def _enhance_all(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fan out enhancement over all events with bounded geocode concurrency.
+
+    Identical location queries within the batch are resolved exactly once
+    and the result fanned back out to every event that shares the query.
+    """
+    # Pass 1: run the cheap local steps and collect each event's query
+    prepared = [_prepare_event(event) for event in events]
+    queries = [build_location_query(enhanced) for enhanced in prepared]
+    unique_queries = {query for query in queries if query}
+
+    # Pass 2: resolve each unique query exactly once, concurrently
+    location_results: Dict[str, Dict[str, Any]] = {}
+    if unique_queries and not GOOGLE_PLACES_API_KEY:
+        # Branch once for the whole batch instead of logging an error per event
+        logger.warning("GOOGLE_PLACES_API_KEY is not set. Enhancing events without geocoding.")
+        location_results = _resolve_queries_offline(unique_queries)
+    elif unique_queries:
+        logger.info(f"Resolving {len(unique_queries)} unique location queries for {len(events)} events")
+        sem = asyncio.Semaphore(GEOCODE_MAX_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=GEOCODE_CONNECTION_LIMIT)
+
+        progress_step = max(1, len(unique_queries) // 20)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def resolve(query: str) -> None:
+                async with sem:
+                    location_results[query] = await _get_location_details_async(session, query)
+                if len(location_results) % progress_step == 0:
+                    logger.info(f"Resolved {len(location_results)}/{len(unique_queries)} location queries")
+
+            await asyncio.gather(*(resolve(query) for query in unique_queries))
+
+    # Pass 3: fan the results back out and finish the local transforms
+    return [_finalize_event(enhanced, location_results.get(query, {}))
+            for enhanced, query in zip(prepared, queries)]
+
+async def enhance_events_async(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Enhance a list of events concurrently (for callers already inside an event loop).
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        List of enhanced event dictionaries
+    """
+    if not events:
+        logger.warning("No events to enhance")
+        return events
+
+    logger.info(f"Enhancing {len(events)} events with additional data")
+    enhanced_events = await _enhance_all(events)
+    logger.info("Finished enhancing all events")
+    return enhanced_events
+
+def enhance_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Enhance a list of events with additional data (synchronous entry point).
+
+    Geocode lookups for the batch's unique queries run on a thread pool,
+    overlapping the HTTP waits without requiring an event loop. requests
+    releases the GIL during I/O, so this scales close to the pool size.
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        List of enhanced event dictionaries
+    """
+    if not events:
+        logger.warning("No events to enhance")
+        return events
+
+    logger.info(f"Enhancing {len(events)} events with additional data")
+
+    # Run the cheap local steps and collect each event's query
+    prepared = [_prepare_event(event) for event in events]
+    queries = [build_location_query(enhanced) for enhanced in prepared]
+    unique_queries = sorted({query for query in queries if query})
+
+    # Resolve each unique query exactly once, overlapping the HTTP waits
+    location_results: Dict[str, Dict[str, Any]] = {}
+    if unique_queries and not GOOGLE_PLACES_API_KEY:
+        # Branch once for the whole batch instead of logging an error per event
+        logger.warning("GOOGLE_PLACES_API_KEY is not set. Enhancing events without geocoding.")
+        location_results = _resolve_queries_offline(unique_queries)
+    elif unique_queries:
+        logger.info(f"Resolving {len(unique_queries)} unique location queries for {len(events)} events")
+        progress_step = max(1, len(unique_queries) // 20)
+        with ThreadPoolExecutor(max_workers=GEOCODE_MAX_WORKERS) as executor:
+            for i, (query, result) in enumerate(
+                    zip(unique_queries, executor.map(get_location_details, unique_queries)), start=1):
+                location_results[query] = result
+                if i % progress_step == 0:
+                    logger.info(f"Resolved {i}/{len(unique_queries)} location queries")
+
+    enhanced_events = [_finalize_event(enhanced, location_results.get(query, {}))
+                       for enhanced, query in zip(prepared, queries)]
+    logger.info("Finished enhancing all events")
+    return enhanced_events
+
+# Example usage if run directly
+if __name__ == "__main__":
+    configure_logging()
+
+    # Test with a few sample events
+    sample_events = [
+        {
+            "title": "WSRE Wine & Food Classic",
+            "date": "March 29, 2025, 7 PM - 10 PM",
+            "venue": "WSRE Jean & Paul Amos Performance Studio",
+            "description": "A celebration of regional flavors featuring fine wines and gourmet dishes."
+        },
+        {
+            "title": "Pensacola Symphony Orchestra Presents Strauss & Schubert",
+            "date": "March 29, 2025, 7:30 PM - 9:30 PM",
+            "venue": "Saenger Theatre, Pensacola",
+            "description": "Experience Richard Strauss' Oboe Concerto performed by Titus Underwood, along with Strauss' Serenade for Winds and Schubert's Ninth Symphony, 'The Great.'"
+        }
+    ]
+    
+    # Enhance the sample events
+    enhanced_events = enhance_events(sample_events)
+    
+    # Print the results
+    import json
+    for event in enhanced_events:
+        print(json.dumps(event, indent=2))
         print("-----")
\ No newline at end of file
@@ -1,476 +1,1037 @@
-# EventEditorAgent.py
-
-import asyncio
-import logging
-import json
-import os
-from typing import Dict, Any, List, Optional
-# Ensure the 'agents' library is installed and configured correctly
-# pip install agents-dev # Or however the library is named/installed
-try:
-    from agents import Agent, Runner
-    from agents.model_settings import ModelSettings
-except ImportError:
-    logging.error("The 'agents' library is not installed or accessible. Please install it.")
-    # Define dummy classes to allow the script to load without the library for basic structure review
-    class Agent:
-        def __init__(self, name, instructions, model_settings, **kwargs): pass
-    class Runner:
-        @staticmethod
-        async def run(agent, prompt):
-            logging.warning("Dummy Runner.run called. 'agents' library not fully functional.")
-            # Simulate a response structure
-            class DummyResult:
-                final_output = "Dummy description generated because 'agents' library is missing."
-            await asyncio.sleep(0.1) # Simulate async work
-            return DummyResult()
-    class ModelSettings:
-        def __init__(self, temperature, max_tokens): pass
-
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('EventEditorAgent')
-
-# --- API Key Handling ---
-# Ensure the OpenAI API key is set via environment variable.
-# The 'agents' library or the underlying OpenAI client library typically
-# looks for the OPENAI_API_KEY environment variable automatically.
-# We add an explicit check here for clarity and early failure if needed.
-if "OPENAI_API_KEY" not in os.environ:
-    logger.warning(
-        "OPENAI_API_KEY environment variable not found. "
-        "The agent WILL likely fail if it requires OpenAI API access for description generation. "
-        "Ensure the key is set in your environment (e.g., export OPENAI_API_KEY='your_key')."
-    )
-    # Depending on requirements, you might want to raise an error immediately:
-    # raise ValueError("FATAL: OPENAI_API_KEY environment variable is not set.")
-# --- End API Key Handling ---
-
-
-# Define the agent with specific instructions for generating event descriptions
-event_editor_agent = Agent(
-    name="EventEditor",
-    instructions="""
-    You are an event description generator specialized in creating engaging, accurate descriptions
-    for events based on the available information. Your task is to enhance incomplete event data
-    by filling in missing fields, with a primary focus on creating compelling descriptions.
-
-    Given partial event information, you will:
-
-    1. Generate a concise but informative description (1-3 sentences, 100-200 characters)
-    2. Fill in any other missing essential fields when possible based *only* on the provided context.
-    3. Ensure the content is factual and based on the provided information.
-
-    When writing descriptions:
-    - Highlight the key elements of the event (what, who [if known], why)
-    - Include the venue and location context if relevant and provided
-    - Mention any special features or notable aspects if provided
-    - Keep the tone appropriate for the event type
-    - Be concise but informative (strictly 100-200 characters)
-
-    Your output should be a complete JSON object representing the enhanced event data if asked to fill multiple fields.
-    If specifically asked *only* for the description, return *only* the description text, nothing else.
-
-    IMPORTANT: Do not invent specific details like performers, speakers, precise activities, exact times, or specific costs unless
-    they are explicitly mentioned in the original data. Use general descriptions that are highly likely to be accurate
-    based *only* on the event title, venue, and type provided. If essential details are missing, generate a description
-    that reflects this uncertainty (e.g., "Join us for [Event Title] at [Venue]. More details coming soon!").
-    """,
-    model_settings=ModelSettings(
-        temperature=0.7,  # Slightly higher for more creative but grounded descriptions
-        max_tokens=500     # Reduced max_tokens as we expect concise output
-    ),
-    # Note: If the 'agents' library requires the API key to be passed explicitly,
-    # you might modify the Agent initialization like this:
-    # api_key=os.environ.get("OPENAI_API_KEY"),
-    # However, most modern libraries handle this automatically via environment variables.
-)
-
-async def generate_event_description(event: Dict[str, Any]) -> str:
-    """
-    Generate a description for an event using the AI agent.
-
-    Args:
-        event: Event dictionary with available information
-
-    Returns:
-        Generated description string or a default if generation fails.
-    """
-    # Check if API key is available before proceeding
-    if "OPENAI_API_KEY" not in os.environ:
-        logger.error("Cannot generate description: OPENAI_API_KEY is not set.")
-        return "Event description generation requires API key. Please check configuration."
-
-    event_name = event.get('name', event.get('title', ''))
-    if not event_name:
-        logger.warning("Cannot generate description for event with no name or title.")
-        return "Details for this event are being finalized. Check back soon!"
-
-    # Create a summary of the event to give context to the agent
-    # Filter out None or empty values for a cleaner summary
-    summary_parts = [
-        f"Title: {event_name}",
-        f"Date/Time: {event.get('start_date', 'Unknown')} at {event.get('start_time', 'Unknown')}",
-        f"Venue: {event.get('venue', 'Unknown')}",
-        # Combine location parts carefully
-        f"Location: {', '.join(filter(None, [event.get('city', ''), event.get('state', ''), event.get('country', '')])) or 'Unknown'}",
-        f"Current Description: {event.get('description') if event.get('description') else '(Missing)'}"
-    ]
-    event_summary = "\n".join(summary_parts)
-
-    # Prepare the prompt for the agent, specifically asking only for the description
-    prompt = f"""
-    Based *only* on the information below, generate a concise, engaging description (1-3 sentences, 100-200 characters) for the event.
-    Return *only* the description text, nothing else. Do not add any preamble or explanation.
-
-    Event Information:
-    {event_summary}
-
-    Description:
-    """
-
-    logger.info(f"Generating description for: {event_name}")
-
-    try:
-        # Run the agent
-        result = await Runner.run(event_editor_agent, prompt)
-
-        # Extract the description from the agent's response
-        description = result.final_output.strip().replace('"', '') # Clean quotes just in case
-
-        # Basic validation
-        if not description or len(description) < 10:
-            logger.warning(f"Generated description seems too short or invalid: '{description}'. Using default.")
-            description = f"Join us for {event_name} at {event.get('venue', 'the venue')}. More details coming soon."
-        elif len(description) > 250: # Allow slightly more than 200 just in case, but log
-             logger.warning(f"Generated description is long ({len(description)} chars). Truncating may occur elsewhere.")
-             # You could truncate here if needed: description = description[:200] + "..."
-
-        logger.info(f"Generated description ({len(description)} chars): {description[:70]}...")
-        return description
-
-    except Exception as e:
-        logger.error(f"Error generating description for '{event_name}' using AI: {e}")
-        logger.info(f"Providing default description for '{event_name}' due to generation error.")
-        # Provide a safe fallback description
-        fallback_desc = f"Join us for {event_name}"
-        if event.get('venue'):
-            fallback_desc += f" at {event.get('venue')}"
-        fallback_desc += ". Check back soon for more details!"
-        return fallback_desc
-
-
-async def enhance_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Enhance an event by adding or improving its description and filling/normalizing other fields.
-
-    Args:
-        event: Original event dictionary
-
-    Returns:
-        Enhanced event dictionary
-    """
-    # Make a copy of the event to avoid modifying the original
-    enhanced_event = event.copy()
-
-    # --- Name/Title Normalization ---
-    if not enhanced_event.get('name') and enhanced_event.get('title'):
-        enhanced_event['name'] = enhanced_event.get('title')
-    if not enhanced_event.get('title') and enhanced_event.get('name'):
-        enhanced_event['title'] = enhanced_event.get('name')
-    # Ensure there's at least a placeholder if both are missing
-    if not enhanced_event.get('name'):
-        enhanced_event['name'] = "Untitled Event"
-        enhanced_event['title'] = "Untitled Event" # Keep them consistent
-
-    # --- Description Enhancement ---
-    current_desc = enhanced_event.get('description', '').strip()
-    if not current_desc:
-        logger.info(f"Event '{enhanced_event['name']}' needs a description. Generating...")
-        # Generate description only if needed
-        generated_description = await generate_event_description(enhanced_event)
-        enhanced_event['description'] = generated_description
-    else:
-        # Optional: Could add logic here to regenerate if description is too short/generic
-        # e.g., if len(current_desc) < 20: ...
-        pass
-
-    # --- Tag IDs ---
-    if 'tag_ids' not in enhanced_event or not enhanced_event['tag_ids']:
-        # Consider deriving tags from title/description later if possible
-        enhanced_event['tag_ids'] = [1]  # Default to a generic event tag (e.g., 'Music Events' if 1 means that)
-        logger.debug(f"Set default tag_ids for event {enhanced_event['name']}")
-
-    # --- Image URL Normalization ---
-    image = enhanced_event.get('image')
-    image_url = enhanced_event.get('imageURL')
-    if image and not image_url:
-        enhanced_event['imageURL'] = image
-    elif image_url and not image:
-        enhanced_event['image'] = image_url
-    # If neither exists, leave them as potentially None/missing
-
-    # --- District ---
-    if enhanced_event.get('district') is None: # Check specifically for None, allow empty string ''
-        # Default based on location if possible
-        state = str(enhanced_event.get('state', '')).strip().upper()
-        city = str(enhanced_event.get('city', '')).strip()
-        if state in ['FLORIDA', 'FL'] and city.lower() == 'pensacola':
-             enhanced_event['district'] = 'Escambia County'
-             logger.debug(f"Set default district 'Escambia County' for Pensacola event {enhanced_event['name']}")
-        else:
-             enhanced_event['district'] = '' # Use empty string instead of null for potentially required fields
-             logger.debug(f"Set default empty district for event {enhanced_event['name']}")
-
-    # --- Coordinate Normalization and Validation ---
-    lat, lng = None, None
-    lat_keys = ['latitude', 'lat']
-    lng_keys = ['longitude', 'lng']
-
-    # Try to find valid lat/lng from available keys
-    for key in lat_keys:
-        val = enhanced_event.get(key)
-        if val is not None:
-            try:
-                lat = float(val)
-                break # Found valid lat
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid value '{val}' for key '{key}' in event '{enhanced_event['name']}'. Ignoring.")
-    for key in lng_keys:
-        val = enhanced_event.get(key)
-        if val is not None:
-            try:
-                lng = float(val)
-                break # Found valid lng
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid value '{val}' for key '{key}' in event '{enhanced_event['name']}'. Ignoring.")
-
-    # If valid coordinates were found, ensure all standard keys are set
-    if lat is not None and lng is not None:
-        # Add basic range check
-        if -90 <= lat <= 90 and -180 <= lng <= 180:
-            enhanced_event['latitude'] = lat
-            enhanced_event['longitude'] = lng
-            enhanced_event['lat'] = lat
-            enhanced_event['lng'] = lng
-            logger.debug(f"Normalized coordinates for event {enhanced_event['name']}")
-        else:
-            logger.warning(f"Coordinates ({lat}, {lng}) out of valid range for event '{enhanced_event['name']}'. Setting to default.")
-            lat, lng = None, None # Invalidate them
-
-    # If coordinates are still missing or were invalidated, try setting defaults
-    if lat is None or lng is None:
-        logger.warning(f"Missing or invalid coordinates for event '{enhanced_event['name']}'. Attempting default based on location.")
-        is_pensacola = enhanced_event.get('city', '').lower() == 'pensacola' or \
-                       'pensacola' in enhanced_event.get('address', '').lower()
-
-        if is_pensacola:
-            default_lat, default_lng = 30.421309, -87.216915
-            enhanced_event['latitude'] = default_lat
-            enhanced_event['longitude'] = default_lng
-            enhanced_event['lat'] = default_lat
-            enhanced_event['lng'] = default_lng
-            logger.info(f"Set default Pensacola coordinates for {enhanced_event['name']}")
-        else:
-            # Set to None if no default is applicable; avoid using (0,0) unless specifically intended
-            enhanced_event['latitude'] = None
-            enhanced_event['longitude'] = None
-            enhanced_event['lat'] = None
-            enhanced_event['lng'] = None
-            logger.warning(f"Could not determine default coordinates for {enhanced_event['name']}. Coordinates set to None.")
-
-    # --- Final Null Value Check (Optional) ---
-    # Remove keys with None values if they might cause issues downstream,
-    # but be cautious as None might be acceptable/intended.
-    # Example: If 'district' MUST NOT be null, we already defaulted it to ''.
-    # keys_to_remove_if_null = ['some_optional_field']
-    # for key in keys_to_remove_if_null:
-    #     if key in enhanced_event and enhanced_event[key] is None:
-    #         del enhanced_event[key]
-
-    return enhanced_event
-
-
-async def enhance_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Enhance multiple events in parallel.
-
-    Args:
-        events: List of event dictionaries
-
-    Returns:
-        List of enhanced event dictionaries
-    """
-    if not events:
-        return []
-
-    logger.info(f"Enhancing {len(events)} events with the EventEditorAgent")
-
-    # Run enhancements concurrently
-    tasks = [enhance_event(event) for event in events]
-    # return_exceptions=True allows processing to continue even if one task fails
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Process results, filtering out potential exceptions and logging them
-    enhanced_events_list = []
-    for i, result in enumerate(results):
-        original_event_name = events[i].get("name", events[i].get("title", f"Event at index {i}"))
-        if isinstance(result, Exception):
-            logger.error(f"Error enhancing event '{original_event_name}': {result}", exc_info=False) # Set exc_info=True for full traceback
-            # Decide how to handle failures: skip, include original, include partially enhanced?
-            # Option: Append original event if enhancement failed
-            # enhanced_events_list.append(events[i])
-            # Option: Skip the failed event
-            continue
-        else:
-            enhanced_events_list.append(result)
-
-    successful_count = len(enhanced_events_list)
-    failed_count = len(events) - successful_count
-    logger.info(f"Successfully enhanced {successful_count} events.")
-    if failed_count > 0:
-        logger.warning(f"Failed to enhance {failed_count} events.")
-
-    return enhanced_events_list
-
-
-async def fix_invalid_events(invalid_events_info: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Attempt to fix invalid events based on their error messages using enhance_event logic.
-    This assumes 'enhance_event' contains the necessary fixes for common validation errors.
-
-    Args:
-        invalid_events_info: List of dictionaries, each containing 'event' (the data)
-                               and 'errors' (list of error strings).
-
-    Returns:
-        List of potentially fixed event dictionaries. These might still not pass validation.
-    """
-    if not invalid_events_info:
-        return []
-
-    logger.info(f"Attempting to fix {len(invalid_events_info)} invalid events using enhancement logic.")
-
-    tasks = []
-    original_event_data = [] # Keep track of original data for logging/debugging
-
-    for invalid_item in invalid_events_info:
-        event_data = invalid_item.get('event')
-        errors = invalid_item.get('errors', [])
-
-        if not event_data:
-            logger.warning("Skipping invalid item with no event data.")
-            continue
-
-        event_name = event_data.get('name', event_data.get('title', 'Unknown Event'))
-        logger.info(f"Queueing fix attempt for event: '{event_name}' with errors: {', '.join(errors)}")
-
-        # We reuse enhance_event as it's designed to fill gaps and normalize data.
-        # Pass a copy to avoid modifying the dictionary within invalid_events_info
-        tasks.append(enhance_event(event_data.copy()))
-        original_event_data.append(event_data) # Store original for comparison if needed
-
-    if not tasks:
-        return []
-
-    # Run the enhancements (fix attempts) in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Process results
-    potentially_fixed_events = []
-    for i, result in enumerate(results):
-        event_name = original_event_data[i].get('name', original_event_data[i].get('title', f'Event at index {i}'))
-        if isinstance(result, Exception):
-            logger.error(f"Error trying to fix/enhance event '{event_name}': {result}", exc_info=False)
-            # Decide if you want to include the original event data even if fixing failed
-            # potentially_fixed_events.append(original_event_data[i])
-        else:
-            logger.info(f"Applied potential fixes/enhancements to event: '{event_name}'")
-            potentially_fixed_events.append(result) # Add the potentially fixed event
-
-    logger.info(f"Finished attempting fixes. Produced {len(potentially_fixed_events)} potentially fixed events.")
-    return potentially_fixed_events
-
-
-# Example usage if run directly
-async def main():
-    # Test case 1: Event missing description, has null coords but also lat/lng
-    sample_event_1 = {
-        "title": "Stellar Spectrum Society Presents: Yewz",
-        "start_date": "2025-03-29", "start_time": "20:00:00",
-        "end_date": "2025-03-30", "end_time": "02:00:00",
-        "venue": "850 Fusion",
-        "address": "7250 Plantation Rd, Pensacola, FL 32504, USA",
-        "city": "Pensacola", "state": "Florida", "country": "United States",
-        "description": "",  # Empty description
-        "url": "https://www.stellarspectrumsociety.com/event-details/yewz",
-        "image": "https://...", "imageURL": "https://...",
-        "latitude": None, "longitude": None, # Null coordinates
-        "lat": 30.497538, "lng": -87.2260669, # But has these valid ones
-        "tag_ids": [] # Empty tags
-    }
-
-    # Test case 2: Event with minimal info, missing coords, tags, district
-    sample_event_2 = {
-        "name": "Community Workshop",
-        "start_date": "2024-09-15", "start_time": "14:00:00",
-        "venue": "Downtown Library",
-        "city": "Anytown", "state": "CA",
-        "description": "A brief workshop description.", # Has a description
-        # Missing coords, tags, district, etc.
-    }
-
-    # Test case 3: Event with invalid coords
-    sample_event_3 = {
-        "name": "Data Glitch Fest",
-        "start_date": "2024-10-01", "start_time": "10:00:00",
-        "venue": "Server Room B",
-        "city": "Tech City", "state": "TX",
-        "description": "",
-        "latitude": "invalid", "longitude": 999 # Invalid lat format, invalid lng value
-    }
-
-    print("--- Enhancing Single Event (Event 1) ---")
-    enhanced_event_1 = await enhance_event(sample_event_1)
-    print("\nOriginal event 1 (subset):")
-    print(json.dumps({k: v for k, v in sample_event_1.items() if k in ['title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
-    print("\nEnhanced event 1 (subset):")
-    print(json.dumps({k: v for k, v in enhanced_event_1.items() if k in ['title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
-
-    print("\n--- Enhancing Multiple Events ---")
-    events_to_enhance = [sample_event_1, sample_event_2, sample_event_3]
-    enhanced_list = await enhance_events(events_to_enhance)
-    print(f"\nSuccessfully processed {len(enhanced_list)} events:")
-    for i, event in enumerate(enhanced_list):
-         print(f"\nEnhanced Event {i+1} ('{event.get('name')}') (subset):")
-         print(json.dumps({k: v for k, v in event.items() if k in ['name', 'title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
-
-    print("\n--- Fixing Invalid Events (Simulated) ---")
-    # Simulate finding invalid events after an API call attempt
-    invalid_event_info = [
-         {
-             "event": sample_event_1, # Missing desc, null coords (but had lat/lng), empty tags
-             "errors": ["description cannot be empty", "tag_ids cannot be empty"] # Example errors
-         },
-         {
-             "event": sample_event_3, # Invalid coords, missing desc
-             "errors": ["description cannot be empty", "Invalid coordinates"]
-         }
-    ]
-
-    fixed_list = await fix_invalid_events(invalid_event_info)
-    print(f"\nAttempted to fix {len(invalid_event_info)} events, resulting in {len(fixed_list)} potentially fixed events:")
-    for i, event in enumerate(fixed_list):
-         print(f"\nPotentially Fixed Event {i+1} ('{event.get('name')}') (subset):")
-         print(json.dumps({k: v for k, v in event.items() if k in ['name', 'title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
-
-
-if __name__ == "__main__":
-    # To run the example with AI description generation, ensure OPENAI_API_KEY is set in your environment:
-    # E.g., in Linux/macOS: export OPENAI_API_KEY='your_actual_api_key'
-    # E.g., in Windows (cmd): set OPENAI_API_KEY=your_actual_api_key
-    # E.g., in Windows (PowerShell): $env:OPENAI_API_KEY='your_actual_api_key'
-    # Then run: python EventEditorAgent.py
-    # If the key is not set, it will log warnings and use default/fallback logic.
-    asyncio.run(main())
\ No newline at end of file
+# EventEditorAgent.py
+
+import asyncio
+import hashlib
+import io
+import logging
+import json
+import math
+import os
+import random
+import re
+import sqlite3
+import textwrap
+import time
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Dict, Any, List, Optional
+
+# Optional: orjson speeds up cache-key hashing and batch-response parsing;
+# stdlib json stays in use for the human-readable output in main()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# Ensure the 'agents' library is installed and configured correctly
+# pip install agents-dev # Or however the library is named/installed
+try:
+    from agents import Agent, Runner
+    from agents.model_settings import ModelSettings
+except ImportError:
+    # Fail fast: the old dummy-class fallback let production runs silently
+    # produce bogus "Dummy description" output
+    raise ImportError(
+        "The 'agents' library is required for EventEditorAgent; "
+        "install it (e.g. pip install agents-dev)."
+    ) from None
+
+logger = logging.getLogger('EventEditorAgent')
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for standalone use of this module.
+
+    Importers (the pipeline scripts) configure logging themselves, so this
+    is opt-in rather than a side effect of import.
+
+    Args:
+        level: Logging level for the root logger
+    """
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- API Key Handling ---
+# Ensure the OpenAI API key is set via environment variable.
+# The 'agents' library or the underlying OpenAI client library typically
+# looks for the OPENAI_API_KEY environment variable automatically.
+# We add an explicit check here for clarity and early failure if needed.
+if "OPENAI_API_KEY" not in os.environ:
+    logger.warning(
+        "OPENAI_API_KEY environment variable not found. "
+        "The agent WILL likely fail if it requires OpenAI API access for description generation. "
+        "Ensure the key is set in your environment (e.g., export OPENAI_API_KEY='your_key')."
+    )
+    # Depending on requirements, you might want to raise an error immediately:
+    # raise ValueError("FATAL: OPENAI_API_KEY environment variable is not set.")
+# --- End API Key Handling ---
+
+
+# --- Shared HTTP client ---
+# Without an explicit shared client the underlying OpenAI SDK may pay a
+# fresh TCP+TLS handshake per request from short-lived scripts. One pooled
+# httpx client reused for every Runner.run keeps connections warm across
+# the whole fan-out. Best-effort: silently skipped when the hooks aren't
+# available (old SDK without set_default_openai_client, no API key).
+_HTTP_CLIENT = None
+if "OPENAI_API_KEY" in os.environ:
+    try:
+        import httpx
+        from openai import AsyncOpenAI
+        from agents import set_default_openai_client
+
+        _HTTP_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30.0,
+        )
+        set_default_openai_client(AsyncOpenAI(http_client=_HTTP_CLIENT))
+        logger.debug("Configured shared pooled HTTP client for LLM calls")
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning(f"Could not configure shared HTTP client: {e}")
+# --- End Shared HTTP client ---
+
+# Generated-description cache configuration. Recurring events (same
+# title/venue/location/date) are common in venue feeds; caching turns their
+# repeat LLM calls into dict lookups.
+DESC_CACHE_FILE = os.environ.get("EVENT_DESC_CACHE_FILE", "event_desc_cache.db")
+DESC_CACHE_TTL_SECONDS = 30 * 24 * 3600  # Entries older than ~30 days are skipped on load
+
+# Cap concurrent LLM calls so large batches don't trip the account's
+# RPM/connection limits and stall in 429 backoff. Only the Runner.run call
+# is gated — the pure-Python normalization stays fully parallel.
+EVENT_EDITOR_MAX_CONCURRENCY = int(os.environ.get("EVENT_EDITOR_MAX_CONCURRENCY", "10"))
+_LLM_SEM = asyncio.Semaphore(EVENT_EDITOR_MAX_CONCURRENCY)
+
+# Per-minute request/token budgets for the proactive rate limiter below.
+# Defaults match a typical low-tier OpenAI account; override per deployment.
+EVENT_EDITOR_RPM = int(os.environ.get("EVENT_EDITOR_RPM", "60"))
+EVENT_EDITOR_TPM = int(os.environ.get("EVENT_EDITOR_TPM", "90000"))
+
+
+class _RateLimiter:
+    """
+    Token-bucket limiter holding both a requests-per-minute and a
+    tokens-per-minute budget.
+
+    Spending the budget *before* dispatch keeps utilization near the quota
+    ceiling without tripping 429s, which cost far more wall-clock in
+    reactive backoff than the proactive waits here. Buckets refill lazily
+    from elapsed time on each acquire — no background task needed.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Block until one request slot and the estimated tokens are available."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._requests >= 1.0 and self._tokens >= tokens:
+                    self._requests -= 1.0
+                    self._tokens -= tokens
+                    return
+                # Sleep just long enough for the deficit to refill
+                request_wait = max(0.0, (1.0 - self._requests) * 60.0 / self.rpm)
+                token_wait = max(0.0, (tokens - self._tokens) * 60.0 / self.tpm)
+                delay = max(request_wait, token_wait, 0.05)
+            await asyncio.sleep(delay)
+
+
+_RATE_LIMITER = _RateLimiter(EVENT_EDITOR_RPM, EVENT_EDITOR_TPM)
+
+def _estimate_tokens(prompt: str, max_output: int) -> int:
+    """Rough prompt+completion token estimate (~4 chars/token for English)."""
+    return len(prompt) // 4 + max_output
+
+# Transient OpenAI/network errors worth retrying. openai itself is always
+# importable here (agents depends on it), but very old versions predate some
+# of these names — fall back to an empty tuple rather than crash at import.
+try:
+    from openai import RateLimitError, APITimeoutError, APIConnectionError, InternalServerError
+    _RETRYABLE_LLM_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+except ImportError:
+    _RETRYABLE_LLM_ERRORS = ()
+
+LLM_MAX_ATTEMPTS = 5
+LLM_BACKOFF_BASE = 1.0   # Seconds
+LLM_BACKOFF_CAP = 30.0   # Seconds
+
+async def _run_with_retry(prompt: str, agent=None, max_output: int = None):
+    """
+    Run an agent, retrying transient errors with jittered exponential backoff.
+
+    Only rate-limit, timeout, connection, and 5xx errors are retried —
+    anything else (bad request, auth) propagates immediately so callers'
+    fallback logic still sees real failures. The rate limiter is charged
+    per attempt, keeping retries inside the per-minute budgets.
+    """
+    tokens = _estimate_tokens(prompt, DESC_MAX_TOKENS if max_output is None else max_output)
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        await _RATE_LIMITER.acquire(tokens)
+        try:
+            return await Runner.run(agent or event_editor_agent, prompt)
+        except _RETRYABLE_LLM_ERRORS as e:
+            if attempt == LLM_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(LLM_BACKOFF_CAP, LLM_BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 0.5)
+            logger.warning("Transient LLM error (%s); retrying in %.1fs", type(e).__name__, delay)
+            await asyncio.sleep(delay)
+
+# System instructions, dedented once at import. Keeping this byte-identical
+# across every request (no interpolation, no per-run content) lets the API
+# reuse its cached prompt prefix: cheaper input tokens and lower TTFT on
+# every call after the first.
+_SYSTEM_PROMPT = textwrap.dedent("""
+    You are an event description generator specialized in creating engaging, accurate descriptions
+    for events based on the available information. Your task is to enhance incomplete event data
+    by filling in missing fields, with a primary focus on creating compelling descriptions.
+
+    Given partial event information, you will:
+
+    1. Generate a concise but informative description (1-3 sentences, 100-200 characters)
+    2. Fill in any other missing essential fields when possible based *only* on the provided context.
+    3. Ensure the content is factual and based on the provided information.
+
+    When writing descriptions:
+    - Highlight the key elements of the event (what, who [if known], why)
+    - Include the venue and location context if relevant and provided
+    - Mention any special features or notable aspects if provided
+    - Keep the tone appropriate for the event type
+    - Be concise but informative (strictly 100-200 characters)
+
+    Your output should be a complete JSON object representing the enhanced event data if asked to fill multiple fields.
+    If specifically asked *only* for the description, return *only* the description text, nothing else.
+
+    IMPORTANT: Do not invent specific details like performers, speakers, precise activities, exact times, or specific costs unless
+    they are explicitly mentioned in the original data. Use general descriptions that are highly likely to be accurate
+    based *only* on the event title, venue, and type provided. If essential details are missing, generate a description
+    that reflects this uncertainty (e.g., "Join us for [Event Title] at [Venue]. More details coming soon!").
+    """)
+
+# Stable user-prompt prefixes: the variable event data always comes *after*
+# these so the first tokens of each request are identical and cacheable.
+_DESC_PROMPT_PREFIX = (
+    "Based *only* on the information below, generate a concise, engaging description "
+    "(1-3 sentences, 100-200 characters) for the event.\n"
+    "Return *only* the description text, nothing else. Do not add any preamble or explanation.\n"
+    "\n"
+    "Event Information:\n"
+)
+
+_BATCH_PROMPT_PREFIX = (
+    "For each event in the JSON list below, generate a concise, engaging description "
+    "(1-3 sentences, 100-200 characters) based *only* on the information given.\n"
+    'Return *only* a JSON array of objects {"id": <id>, "description": "<text>"} — '
+    "one per event, same ids, no preamble, no markdown fences.\n"
+    "\n"
+    "Events:\n"
+)
+
+# Model selection and output caps. A 100-200 character description is ~50
+# tokens, so a tight max_tokens keeps the server-side scheduler from
+# reserving budget that is never spent; the batch agent needs headroom for
+# a whole JSON array of descriptions.
+EVENT_EDITOR_MODEL = os.environ.get("EVENT_EDITOR_MODEL", "gpt-4o-mini")
+DESC_MAX_TOKENS = 80
+BATCH_MAX_TOKENS = 2000
+
+# Define the agent with specific instructions for generating event descriptions
+event_editor_agent = Agent(
+    name="EventEditor",
+    instructions=_SYSTEM_PROMPT,
+    model=EVENT_EDITOR_MODEL,
+    model_settings=ModelSettings(
+        temperature=0.7,  # Slightly higher for more creative but grounded descriptions
+        max_tokens=DESC_MAX_TOKENS
+    ),
+    # Note: If the 'agents' library requires the API key to be passed explicitly,
+    # you might modify the Agent initialization like this:
+    # api_key=os.environ.get("OPENAI_API_KEY"),
+    # However, most modern libraries handle this automatically via environment variables.
+)
+
+# Same instructions, larger output budget for the batched JSON responses
+event_editor_batch_agent = Agent(
+    name="EventEditorBatch",
+    instructions=_SYSTEM_PROMPT,
+    model=EVENT_EDITOR_MODEL,
+    model_settings=ModelSettings(
+        temperature=0.7,
+        max_tokens=BATCH_MAX_TOKENS
+    ),
+)
+
+# In-memory description cache, keyed by a hash of the prompt-relevant fields.
+# Loaded from the persistent store at import time so repeat events are dict hits.
+_DESC_CACHE: Dict[str, str] = {}
+
+def _desc_cache_connect() -> sqlite3.Connection:
+    """Open the description cache database, creating the table on first use."""
+    conn = sqlite3.connect(DESC_CACHE_FILE)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, description TEXT, ts INTEGER)")
+    return conn
+
+def _load_desc_cache() -> None:
+    """Load persisted generated descriptions into the in-memory cache."""
+    try:
+        cutoff = int(time.time()) - DESC_CACHE_TTL_SECONDS
+        with _desc_cache_connect() as conn:
+            for key, description in conn.execute("SELECT key, description FROM cache WHERE ts >= ?", (cutoff,)):
+                _DESC_CACHE[key] = description
+        if _DESC_CACHE:
+            logger.info(f"Loaded {len(_DESC_CACHE)} cached event descriptions from {DESC_CACHE_FILE}")
+    except Exception as e:
+        logger.warning(f"Could not load description cache from {DESC_CACHE_FILE}: {e}")
+
+def _store_desc_cache(cache_key: str, description: str) -> None:
+    """Store a generated description in memory and on disk."""
+    _DESC_CACHE[cache_key] = description
+    try:
+        with _desc_cache_connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache (key, description, ts) VALUES (?, ?, ?)",
+                         (cache_key, description, int(time.time())))
+    except Exception as e:
+        logger.warning(f"Could not persist description to {DESC_CACHE_FILE}: {e}")
+
+def _description_cache_key(event: Dict[str, Any]) -> str:
+    """Hash the prompt-relevant fields of an event into a stable cache key."""
+    payload = {
+        'title': event.get('name', event.get('title', '')),
+        'venue': event.get('venue'),
+        'city': event.get('city'),
+        'state': event.get('state'),
+        'date': event.get('start_date'),
+    }
+    if orjson is not None:
+        # orjson emits canonical bytes directly — no intermediate str encode
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+# Warm the cache once at import time
+_load_desc_cache()
+
+# Strips only boundary whitespace and straight/smart quotes in one C-level
+# pass — interior quotes and apostrophes (It's, "live" sets) survive, unlike
+# the old full-string replace('"', '')
+_CLEAN_DESC_RE = re.compile('^[\\s"\u201c\u201d\u2018\u2019\']+|[\\s"\u201c\u201d\u2018\u2019\']+$')
+
+# In-flight description requests keyed by cache key: concurrent duplicates
+# within a batch await one Runner.run instead of each firing their own
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+async def generate_event_description(event: Dict[str, Any],
+                                     sem: Optional[asyncio.Semaphore] = None) -> str:
+    """
+    Generate a description for an event using the AI agent.
+
+    Args:
+        event: Event dictionary with available information
+        sem: Semaphore bounding concurrent LLM calls (defaults to the
+             module-level limit from EVENT_EDITOR_MAX_CONCURRENCY)
+
+    Returns:
+        Generated description string or a default if generation fails.
+    """
+    # Check if API key is available before proceeding
+    if "OPENAI_API_KEY" not in os.environ:
+        logger.error("Cannot generate description: OPENAI_API_KEY is not set.")
+        return "Event description generation requires API key. Please check configuration."
+
+    event_name = event.get('name', event.get('title', ''))
+    if not event_name:
+        logger.warning("Cannot generate description for event with no name or title.")
+        return "Details for this event are being finalized. Check back soon!"
+
+    # Check the cache first — recurring events (same title/venue/location/date)
+    # get their description without an API round-trip
+    cache_key = _description_cache_key(event)
+    cached = _DESC_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Description cache hit for '%s'", event_name)
+        return cached
+
+    # Single-flight: if an identical request is already in the air (duplicate
+    # records within one batch), await its result instead of firing another call
+    inflight = _INFLIGHT.get(cache_key)
+    if inflight is not None:
+        logger.debug("Coalescing duplicate description request for '%s'", event_name)
+        return await inflight
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[cache_key] = future
+    try:
+        description = await _generate_description_uncached(event, event_name, cache_key, sem)
+        future.set_result(description)
+        return description
+    finally:
+        _INFLIGHT.pop(cache_key, None)
+        if not future.done():
+            future.cancel()
+
+
+def _event_summary(event: Dict[str, Any], event_name: str) -> str:
+    """
+    Build the context summary an event's description prompt is based on.
+
+    One f-string, one bound .get — no intermediate list/join per event.
+    """
+    g = event.get
+    location = ', '.join(filter(None, (g('city'), g('state'), g('country')))) or 'Unknown'
+    return (
+        f"Title: {event_name}\n"
+        f"Date/Time: {g('start_date', 'Unknown')} at {g('start_time', 'Unknown')}\n"
+        f"Venue: {g('venue', 'Unknown')}\n"
+        f"Location: {location}\n"
+        f"Current Description: {g('description') or '(Missing)'}"
+    )
+
+
+async def _generate_description_uncached(event: Dict[str, Any], event_name: str,
+                                         cache_key: str,
+                                         sem: Optional[asyncio.Semaphore]) -> str:
+    """Run the actual LLM call for generate_event_description (cache/coalescing miss)."""
+    # Create a summary of the event to give context to the agent
+    event_summary = _event_summary(event, event_name)
+
+    # Prepare the prompt: the stable prefix first, variable summary last,
+    # so requests share a cacheable prefix server-side
+    prompt = f"{_DESC_PROMPT_PREFIX}{event_summary}\n\nDescription:"
+
+    logger.debug("Generating description for: %s", event_name)
+
+    try:
+        # Run the agent, holding the semaphore only for the LLM round-trip
+        async with (sem or _LLM_SEM):
+            result = await _run_with_retry(prompt)
+
+        # Extract the description, trimming boundary quotes/whitespace only
+        description = _CLEAN_DESC_RE.sub('', result.final_output)
+
+        # Basic validation — one length computation for both bounds
+        dlen = len(description)
+        if dlen < 10:
+            logger.warning(f"Generated description seems too short or invalid: '{description}'. Using default.")
+            description = f"Join us for {event_name} at {event.get('venue', 'the venue')}. More details coming soon."
+        else:
+            if dlen > 250: # Allow slightly more than 200 just in case, but log
+                logger.warning(f"Generated description is long ({dlen} chars). Truncating may occur elsewhere.")
+                # You could truncate here if needed: description = description[:200] + "..."
+            # Only cache real model output, never the fallback placeholders
+            _store_desc_cache(cache_key, description)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Generated description ({len(description)} chars): {description[:70]}...")
+        return description
+
+    except Exception as e:
+        logger.error(f"Error generating description for '{event_name}' using AI: {e}")
+        logger.info(f"Providing default description for '{event_name}' due to generation error.")
+        # Provide a safe fallback description
+        fallback_desc = f"Join us for {event_name}"
+        if event.get('venue'):
+            fallback_desc += f" at {event.get('venue')}"
+        fallback_desc += ". Check back soon for more details!"
+        return fallback_desc
+
+
+async def generate_event_descriptions_batch(events: List[Dict[str, Any]],
+                                            batch_size: int = 20,
+                                            sem: Optional[asyncio.Semaphore] = None) -> List[str]:
+    """
+    Generate descriptions for many events with one LLM call per batch.
+
+    One request carrying batch_size events collapses that many network
+    round-trips (and RPM slots) into one; batches still run concurrently
+    under the semaphore. Cache hits are served before batching, and any
+    event the batch response misses falls back to the per-event path.
+
+    Args:
+        events: Event dictionaries needing descriptions
+        batch_size: Number of events per LLM request
+        sem: Semaphore bounding concurrent LLM calls (optional)
+
+    Returns:
+        List of description strings, parallel to the input
+    """
+    if not events:
+        return []
+
+    descriptions: List[Optional[str]] = [None] * len(events)
+
+    # Serve cache hits up front; only misses consume batch slots
+    miss_indices = []
+    for i, event in enumerate(events):
+        cached = _DESC_CACHE.get(_description_cache_key(event))
+        if cached is not None:
+            descriptions[i] = cached
+        else:
+            miss_indices.append(i)
+
+    async def run_batch(indices: List[int]) -> None:
+        entries = [{
+            'id': idx,
+            'title': events[idx].get('name', events[idx].get('title', '')),
+            'venue': events[idx].get('venue'),
+            'city': events[idx].get('city'),
+            'state': events[idx].get('state'),
+            'date': events[idx].get('start_date'),
+        } for idx in indices]
+
+        entries_json = orjson.dumps(entries).decode() if orjson is not None else json.dumps(entries)
+        prompt = _BATCH_PROMPT_PREFIX + entries_json
+
+        try:
+            async with (sem or _LLM_SEM):
+                result = await _run_with_retry(prompt, agent=event_editor_batch_agent,
+                                               max_output=BATCH_MAX_TOKENS)
+            output = result.final_output.strip()
+            # Tolerate markdown fences despite the instructions
+            if output.startswith("```"):
+                output = output.strip("`")
+                if output.startswith("json"):
+                    output = output[4:]
+            parsed = orjson.loads(output) if orjson is not None else json.loads(output)
+            by_id = {int(item['id']): str(item.get('description', '')).strip()
+                     for item in parsed if 'id' in item}
+        except Exception as e:
+            logger.error(f"Batch description generation failed for {len(indices)} events: {e}")
+            by_id = {}
+
+        for idx in indices:
+            description = by_id.get(idx, '')
+            if description and len(description) >= 10:
+                descriptions[idx] = description
+                _store_desc_cache(_description_cache_key(events[idx]), description)
+
+    if miss_indices and "OPENAI_API_KEY" in os.environ:
+        batches = [miss_indices[i:i + batch_size] for i in range(0, len(miss_indices), batch_size)]
+        logger.info(f"Generating {len(miss_indices)} descriptions in {len(batches)} batched LLM calls")
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+    # Per-event fallback for anything the batches didn't produce — this
+    # path also supplies the safe default strings when the API is down
+    for i, description in enumerate(descriptions):
+        if not description:
+            descriptions[i] = await generate_event_description(events[i], sem=sem)
+
+    return descriptions
+
+
+# Canonical coordinate key orders, interned once at module level
+_LAT_KEYS = ('latitude', 'lat')
+_LNG_KEYS = ('longitude', 'lng')
+
+# Region defaults, keyed on (state, city). One hash lookup replaces the
+# chained string comparisons for both the district and coordinate
+# defaults, and adding a region is one dict entry instead of new branches.
+_STATE_ALIASES = {'FLORIDA': 'FL'}
+_REGION_DEFAULTS = {
+    ('FL', 'pensacola'): {'district': 'Escambia County', 'lat': 30.421309, 'lng': -87.216915},
+}
+
+def _region_defaults(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Look up district/coordinate defaults for an event's state and city."""
+    state = str(event.get('state', '')).strip().upper()
+    city = str(event.get('city', '')).strip().lower()
+    return _REGION_DEFAULTS.get((_STATE_ALIASES.get(state, state), city))
+
+# Plain decimal (optionally exponent-form) numbers; "nan"/"inf" deliberately
+# excluded so they fall through to the invalid-value path
+_NUMERIC_RE = re.compile(r'^[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$')
+
+def _coerce_coordinate(event: Dict[str, Any], keys: tuple, event_name: str) -> Optional[float]:
+    """
+    Return the first usable float among the given keys, or None.
+
+    Numeric values short-circuit on an isinstance check and strings are
+    vetted by a compiled pattern before float() — no exception is raised
+    or caught for the ""/None/"N/A" garbage common in scraped feeds, which
+    costs microseconds per event at 10k-event scale.
+    """
+    get = event.get
+    for key in keys:
+        val = get(key)
+        if val is None:
+            continue
+        if isinstance(val, (int, float)):
+            if math.isfinite(val):
+                return float(val)
+        elif isinstance(val, str):
+            stripped = val.strip()
+            if _NUMERIC_RE.match(stripped):
+                return float(stripped)
+        logger.warning("Invalid value '%s' for key '%s' in event '%s'. Ignoring.", val, key, event_name)
+    return None
+
+
+@dataclass
+class EnhancementStats:
+    """
+    Aggregate counters for one enhancement run.
+
+    Logged once per batch instead of emitting per-event log records —
+    handler dispatch, lock acquisition, and timestamping per event add up
+    at feed scale even when the message itself is cheap.
+    """
+    desc_generated: int = 0
+    desc_cached: int = 0
+    district_defaulted: int = 0
+    coord_defaulted: int = 0
+    coord_missing: int = 0
+
+
+def _normalize_event(event: Dict[str, Any], copy: bool = True,
+                     stats: Optional[EnhancementStats] = None) -> Dict[str, Any]:
+    """
+    Run the pure-Python (non-LLM) enhancement steps for an event.
+
+    All the dict munging — name/title, tags, image URLs, district, and
+    coordinate normalization — lives here so callers only pay event-loop
+    scheduling for events that actually need a generated description.
+
+    Args:
+        event: Original event dictionary
+        copy: Copy the event instead of mutating it in place. The batch
+            paths pass False — they own their lists, and the copy was the
+            dominant allocation for already-complete events.
+        stats: Optional per-batch counters to update in place.
+
+    Returns:
+        Normalized event (description untouched)
+    """
+    enhanced_event = event.copy() if copy else event
+
+    # --- Name/Title Normalization ---
+    if not enhanced_event.get('name') and enhanced_event.get('title'):
+        enhanced_event['name'] = enhanced_event.get('title')
+    if not enhanced_event.get('title') and enhanced_event.get('name'):
+        enhanced_event['title'] = enhanced_event.get('name')
+    # Ensure there's at least a placeholder if both are missing
+    if not enhanced_event.get('name'):
+        enhanced_event['name'] = "Untitled Event"
+        enhanced_event['title'] = "Untitled Event" # Keep them consistent
+
+    # --- Tag IDs ---
+    if 'tag_ids' not in enhanced_event or not enhanced_event['tag_ids']:
+        # Consider deriving tags from title/description later if possible
+        enhanced_event['tag_ids'] = [1]  # Default to a generic event tag (e.g., 'Music Events' if 1 means that)
+        logger.debug("Set default tag_ids for event %s", enhanced_event['name'])
+
+    # --- Image URL Normalization ---
+    image = enhanced_event.get('image')
+    image_url = enhanced_event.get('imageURL')
+    if image and not image_url:
+        enhanced_event['imageURL'] = image
+    elif image_url and not image:
+        enhanced_event['image'] = image_url
+    # If neither exists, leave them as potentially None/missing
+
+    # Region defaults for district/coordinates — resolved once per event
+    region = _region_defaults(enhanced_event)
+
+    # --- District ---
+    if enhanced_event.get('district') is None: # Check specifically for None, allow empty string ''
+        if region:
+            enhanced_event['district'] = region['district']
+            logger.debug("Set default district '%s' for event %s", region['district'], enhanced_event['name'])
+        else:
+            enhanced_event['district'] = '' # Use empty string instead of null for potentially required fields
+            logger.debug("Set default empty district for event %s", enhanced_event['name'])
+        if stats:
+            stats.district_defaulted += 1
+
+    # --- Coordinate Normalization and Validation ---
+    # Fast path: the canonical keys already hold in-range floats — the
+    # common case for feeds that went through EventDataEnhancer. Skips the
+    # fallback-key scan, float coercion, and logging cascade entirely.
+    lat0 = enhanced_event.get('latitude')
+    lng0 = enhanced_event.get('longitude')
+    if (isinstance(lat0, float) and isinstance(lng0, float)
+            and -90.0 <= lat0 <= 90.0 and -180.0 <= lng0 <= 180.0):
+        enhanced_event['lat'] = lat0
+        enhanced_event['lng'] = lng0
+        return enhanced_event
+
+    # Find the first valid lat/lng among the known keys
+    lat = _coerce_coordinate(enhanced_event, _LAT_KEYS, enhanced_event['name'])
+    lng = _coerce_coordinate(enhanced_event, _LNG_KEYS, enhanced_event['name'])
+
+    # If valid coordinates were found, ensure all standard keys are set
+    if lat is not None and lng is not None:
+        # Add basic range check
+        if -90 <= lat <= 90 and -180 <= lng <= 180:
+            enhanced_event['latitude'] = lat
+            enhanced_event['longitude'] = lng
+            enhanced_event['lat'] = lat
+            enhanced_event['lng'] = lng
+            logger.debug("Normalized coordinates for event %s", enhanced_event['name'])
+        else:
+            logger.warning("Coordinates (%s, %s) out of valid range for event '%s'. Setting to default.", lat, lng, enhanced_event['name'])
+            lat, lng = None, None # Invalidate them
+
+    # If coordinates are still missing or were invalidated, try setting defaults
+    if lat is None or lng is None:
+        logger.warning("Missing or invalid coordinates for event '%s'. Attempting default based on location.", enhanced_event['name'])
+        # City lookup first; fall back to scanning the address for Pensacola
+        coord_region = region
+        if coord_region is None and 'pensacola' in str(enhanced_event.get('address', '')).lower():
+            coord_region = _REGION_DEFAULTS[('FL', 'pensacola')]
+
+        if coord_region:
+            enhanced_event['latitude'] = coord_region['lat']
+            enhanced_event['longitude'] = coord_region['lng']
+            enhanced_event['lat'] = coord_region['lat']
+            enhanced_event['lng'] = coord_region['lng']
+            logger.debug("Set default regional coordinates for %s", enhanced_event['name'])
+            if stats:
+                stats.coord_defaulted += 1
+        else:
+            # Set to None if no default is applicable; avoid using (0,0) unless specifically intended
+            enhanced_event['latitude'] = None
+            enhanced_event['longitude'] = None
+            enhanced_event['lat'] = None
+            enhanced_event['lng'] = None
+            logger.warning("Could not determine default coordinates for %s. Coordinates set to None.", enhanced_event['name'])
+            if stats:
+                stats.coord_missing += 1
+
+    # --- Final Null Value Check (Optional) ---
+    # Remove keys with None values if they might cause issues downstream,
+    # but be cautious as None might be acceptable/intended.
+    # Example: If 'district' MUST NOT be null, we already defaulted it to ''.
+    # keys_to_remove_if_null = ['some_optional_field']
+    # for key in keys_to_remove_if_null:
+    #     if key in enhanced_event and enhanced_event[key] is None:
+    #         del enhanced_event[key]
+
+    return enhanced_event
+
+
+async def enhance_event(event: Dict[str, Any],
+                        sem: Optional[asyncio.Semaphore] = None,
+                        mutate: bool = False) -> Dict[str, Any]:
+    """
+    Enhance an event by adding or improving its description and filling/normalizing other fields.
+
+    Args:
+        event: Original event dictionary
+        sem: Semaphore bounding concurrent LLM calls (optional)
+        mutate: Skip the defensive copy and enhance the dict in place
+            (for callers that own the event)
+
+    Returns:
+        Enhanced event dictionary
+    """
+    enhanced_event = _normalize_event(event, copy=not mutate)
+
+    # Generate a description only if one is actually missing — the only
+    # step that needs the event loop at all
+    if not enhanced_event.get('description', '').strip():
+        logger.debug("Event '%s' needs a description. Generating...", enhanced_event['name'])
+        enhanced_event['description'] = await generate_event_description(enhanced_event, sem=sem)
+
+    return enhanced_event
+
+
+async def enhance_events(events: List[Dict[str, Any]],
+                         max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Enhance multiple events in parallel, with bounded LLM concurrency.
+
+    Args:
+        events: List of event dictionaries
+        max_concurrency: Override for the number of simultaneous LLM calls
+            (defaults to EVENT_EDITOR_MAX_CONCURRENCY)
+
+    Returns:
+        List of enhanced event dictionaries
+    """
+    if not events:
+        return []
+
+    logger.info(f"Enhancing {len(events)} events with the EventEditorAgent")
+
+    sem = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    stats = EnhancementStats()
+
+    # Normalize everything synchronously — pure dict munging, no reason to
+    # schedule a coroutine per event. Only events with a missing description
+    # go through the event loop at all.
+    enhanced_events_list = []
+    needs_description = []
+    for i, event in enumerate(events):
+        original_event_name = event.get("name", event.get("title", f"Event at index {i}"))
+        try:
+            enhanced = _normalize_event(event, copy=False, stats=stats)
+        except Exception as e:
+            logger.error(f"Error enhancing event '{original_event_name}': {e}", exc_info=False)
+            # Skip the failed event
+            continue
+        enhanced_events_list.append(enhanced)
+        if not enhanced.get('description', '').strip():
+            needs_description.append(enhanced)
+            if _description_cache_key(enhanced) in _DESC_CACHE:
+                stats.desc_cached += 1
+            else:
+                stats.desc_generated += 1
+
+    # Batch the LLM calls for the events that actually need one
+    if needs_description:
+        logger.info(f"Generating descriptions for {len(needs_description)} events without one")
+        descriptions = await generate_event_descriptions_batch(needs_description, sem=sem)
+        for enhanced, description in zip(needs_description, descriptions):
+            enhanced['description'] = description
+
+    successful_count = len(enhanced_events_list)
+    failed_count = len(events) - successful_count
+    # One structured summary instead of per-event log chatter
+    logger.info("Enhanced %d events (%d failed): %s",
+                successful_count, failed_count, asdict(stats))
+
+    return enhanced_events_list
+
+
+async def enhance_events_iter(events: List[Dict[str, Any]],
+                              max_concurrency: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield enhanced events as each one becomes ready.
+
+    Already-described events are yielded immediately after normalization;
+    the rest stream out as their LLM calls finish, so downstream writers
+    (DB inserts, API posts) can overlap with the remaining generation
+    instead of waiting on the slowest call. Uses per-event LLM calls —
+    when request count matters more than time-to-first-result, prefer
+    enhance_events, which batches.
+
+    Args:
+        events: List of event dictionaries
+        max_concurrency: Override for the number of simultaneous LLM calls
+
+    Yields:
+        Enhanced event dictionaries, in completion order
+    """
+    if not events:
+        return
+
+    sem = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    needs_description = []
+    for i, event in enumerate(events):
+        original_event_name = event.get("name", event.get("title", f"Event at index {i}"))
+        try:
+            enhanced = _normalize_event(event, copy=False)
+        except Exception as e:
+            logger.error(f"Error enhancing event '{original_event_name}': {e}", exc_info=False)
+            continue
+        if enhanced.get('description', '').strip():
+            yield enhanced
+        else:
+            needs_description.append(enhanced)
+
+    if needs_description:
+        async def describe(enhanced: Dict[str, Any]) -> Dict[str, Any]:
+            enhanced['description'] = await generate_event_description(enhanced, sem=sem)
+            return enhanced
+
+        for future in asyncio.as_completed([describe(e) for e in needs_description]):
+            try:
+                yield await future
+            except Exception as e:
+                logger.error(f"Error generating description: {e}", exc_info=False)
+
+
+# Batch API settings for offline backfills (50% cost, fulfilled within 24h)
+BATCH_API_MODEL = os.environ.get("EVENT_EDITOR_BATCH_MODEL", EVENT_EDITOR_MODEL)
+BATCH_API_POLL_SECONDS = 30
+
+async def enhance_events_via_batch_api(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Enhance events through OpenAI's Batch API instead of live completions.
+
+    For nightly or historical backfills where latency doesn't matter, the
+    Batch API charges half the standard rate and bypasses RPM limits
+    entirely: requests go up as one JSONL file and are fulfilled within
+    24 hours. This call polls until the batch finishes, so only use it
+    when the caller can afford to wait. Normalization and the description
+    cache work exactly as in enhance_events; anything the batch fails to
+    produce falls back to the interactive path.
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        List of enhanced event dictionaries
+    """
+    if not events:
+        return []
+
+    try:
+        from openai import AsyncOpenAI
+    except ImportError:
+        logger.error("openai SDK not available; using the interactive enhancement path.")
+        return await enhance_events(events)
+
+    # Normalize locally and collect the events that need a description
+    enhanced_events_list = []
+    needs_description = []
+    for i, event in enumerate(events):
+        original_event_name = event.get("name", event.get("title", f"Event at index {i}"))
+        try:
+            enhanced = _normalize_event(event, copy=False)
+        except Exception as e:
+            logger.error(f"Error enhancing event '{original_event_name}': {e}", exc_info=False)
+            continue
+        enhanced_events_list.append(enhanced)
+        if not enhanced.get('description', '').strip():
+            cached = _DESC_CACHE.get(_description_cache_key(enhanced))
+            if cached is not None:
+                enhanced['description'] = cached
+            else:
+                needs_description.append(enhanced)
+
+    if not needs_description:
+        return enhanced_events_list
+
+    if "OPENAI_API_KEY" not in os.environ:
+        logger.error("OPENAI_API_KEY is not set; using fallback descriptions.")
+        for enhanced in needs_description:
+            enhanced['description'] = await generate_event_description(enhanced)
+        return enhanced_events_list
+
+    # One JSONL line per missing description, keyed by position
+    lines = []
+    for i, enhanced in enumerate(needs_description):
+        event_name = enhanced.get('name', enhanced.get('title', ''))
+        body = {
+            "model": BATCH_API_MODEL,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user",
+                 "content": f"{_DESC_PROMPT_PREFIX}{_event_summary(enhanced, event_name)}\n\nDescription:"},
+            ],
+            "temperature": 0.7,
+            "max_tokens": DESC_MAX_TOKENS,
+        }
+        lines.append(json.dumps({"custom_id": str(i), "method": "POST",
+                                 "url": "/v1/chat/completions", "body": body}))
+
+    try:
+        client = AsyncOpenAI()
+        batch_file = await client.files.create(
+            file=io.BytesIO("\n".join(lines).encode()), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h")
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} description requests")
+
+        while batch.status in ("validating", "in_progress", "finalizing"):
+            await asyncio.sleep(BATCH_API_POLL_SECONDS)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status == "completed" and batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                try:
+                    item = json.loads(line)
+                    index = int(item["custom_id"])
+                    description = (item["response"]["body"]["choices"][0]
+                                   ["message"]["content"].strip().replace('"', ''))
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.warning(f"Could not parse batch output line: {e}")
+                    continue
+                if description and len(description) >= 10:
+                    needs_description[index]['description'] = description
+                    _store_desc_cache(_description_cache_key(needs_description[index]), description)
+            logger.info(f"Batch {batch.id} completed")
+        else:
+            logger.error(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    except Exception as e:
+        logger.error(f"Batch API enhancement failed: {e}")
+
+    # Interactive fallback for anything the batch didn't produce
+    for enhanced in needs_description:
+        if not enhanced.get('description', '').strip():
+            enhanced['description'] = await generate_event_description(enhanced)
+
+    return enhanced_events_list
+
+
+async def fix_invalid_events(invalid_events_info: List[Dict[str, Any]],
+                             max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Attempt to fix invalid events based on their error messages using enhance_event logic.
+    This assumes 'enhance_event' contains the necessary fixes for common validation errors.
+
+    Args:
+        invalid_events_info: List of dictionaries, each containing 'event' (the data)
+                               and 'errors' (list of error strings).
+        max_concurrency: Override for the number of simultaneous LLM calls
+            (defaults to EVENT_EDITOR_MAX_CONCURRENCY)
+
+    Returns:
+        List of potentially fixed event dictionaries. These might still not pass validation.
+    """
+    if not invalid_events_info:
+        return []
+
+    logger.info(f"Attempting to fix {len(invalid_events_info)} invalid events using enhancement logic.")
+
+    sem = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    tasks = []
+    original_event_data = [] # Keep track of original data for logging/debugging
+
+    for invalid_item in invalid_events_info:
+        event_data = invalid_item.get('event')
+        errors = invalid_item.get('errors', [])
+
+        if not event_data:
+            logger.warning("Skipping invalid item with no event data.")
+            continue
+
+        event_name = event_data.get('name', event_data.get('title', 'Unknown Event'))
+        logger.debug("Queueing fix attempt for event: '%s' with errors: %s", event_name, ', '.join(errors))
+
+        # We reuse enhance_event as it's designed to fill gaps and normalize data.
+        # Pass a copy to avoid modifying the dictionary within invalid_events_info
+        # The .copy() protects invalid_events_info; mutate=True avoids a second copy
+        tasks.append(enhance_event(event_data.copy(), sem=sem, mutate=True))
+        original_event_data.append(event_data) # Store original for comparison if needed
+
+    if not tasks:
+        return []
+
+    # Run the enhancements (fix attempts) in parallel
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Process results
+    potentially_fixed_events = []
+    for i, result in enumerate(results):
+        event_name = original_event_data[i].get('name', original_event_data[i].get('title', f'Event at index {i}'))
+        if isinstance(result, Exception):
+            logger.error(f"Error trying to fix/enhance event '{event_name}': {result}", exc_info=False)
+            # Decide if you want to include the original event data even if fixing failed
+            # potentially_fixed_events.append(original_event_data[i])
+        else:
+            logger.debug("Applied potential fixes/enhancements to event: '%s'", event_name)
+            potentially_fixed_events.append(result) # Add the potentially fixed event
+
+    logger.info(f"Finished attempting fixes. Produced {len(potentially_fixed_events)} potentially fixed events.")
+    return potentially_fixed_events
+
+
+# Example usage lives in examples/event_editor_demo.py
@@ -1,178 +1,443 @@
-# EventImageAttacher.py
-
-import os
-import time
-from typing import List, Dict, Any, Optional
-from googleapiclient.discovery import build
-import logging
-import traceback
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('EventImageAttacher')
-
-# API Configuration
-GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
-SEARCH_ENGINE_ID = os.environ.get("SEARCH_ENGINE_ID")
-
-# Log warning if API keys are missing
-if not GOOGLE_API_KEY or not SEARCH_ENGINE_ID:
-    logger.warning("GOOGLE_API_KEY or SEARCH_ENGINE_ID environment variables are not set. Image search will be disabled.")
-
-def find_event_image(event_title: str, event_location: str) -> Optional[str]:
-    """
-    Find an image for the event using Google Custom Search API.
-
-    Args:
-        event_title: Title of the event
-        event_location: Location of the event (city, state)
-
-    Returns:
-        URL of the image if found, None otherwise
-    """
-    if not GOOGLE_API_KEY or not SEARCH_ENGINE_ID:
-        logger.error("GOOGLE_API_KEY or SEARCH_ENGINE_ID is not set. Cannot search for images.")
-        return None
-
-    query = f"{event_title} {event_location} event"
-    logger.info(f"Searching for image with query: '{query}'")
-
-    try:
-        # Use cache_discovery=False to avoid oauth2client warning
-        service = build("customsearch", "v1", developerKey=GOOGLE_API_KEY, cache_discovery=False)
-        
-        # Execute the search with the correct case for imgSize (UPPERCASE)
-        results = service.cse().list(
-            q=query,
-            cx=SEARCH_ENGINE_ID,
-            searchType='image',
-            num=1,
-            imgSize='LARGE',  # Note: UPPERCASE is required by the API
-            safe='active'     # Safe search
-        ).execute()
-        
-        images = results.get('items', [])
-        if images:
-            image_url = images[0]['link']
-            logger.info(f"Found image for '{event_title}': {image_url}")
-            return image_url
-        else:
-            logger.warning(f"No images found for '{event_title}'")
-            
-    except Exception as e:
-        logger.error(f"Error finding image for '{event_title}': {str(e)}")
-        logger.error(traceback.format_exc())
-    
-    return None
-
-def attach_images(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Process a list of events and attach image URLs to each.
-    
-    Args:
-        events: List of event dictionaries
-        
-    Returns:
-        List of event dictionaries with added image and imageURL fields
-    """
-    if not events:
-        logger.warning("No events to process for image attachment")
-        return events
-    
-    logger.info(f"Attaching images to {len(events)} events")
-    
-    for i, event in enumerate(events):
-        # Skip if event already has an image URL
-        if event.get('imageURL') and event['imageURL'] != "":
-            logger.info(f"Event {i+1}/{len(events)} already has an image: {event.get('name', event.get('title', 'Unnamed event'))}")
-            # Make sure 'image' field is also set to maintain compatibility with the API
-            event['image'] = event['imageURL']
-            continue
-        
-        # Get event information for the image search
-        event_name = event.get('name', event.get('title', ''))
-        event_location = f"{event.get('city', '')}, {event.get('state', '')}"
-        
-        if not event_name:
-            logger.warning(f"Event {i+1}/{len(events)} has no name/title, skipping image search")
-            default_image = "https://picsum.photos/800/600"  # Default image
-            event['imageURL'] = default_image
-            event['image'] = default_image  # Add 'image' field for API compatibility
-            continue
-        
-        # Find image for the event
-        logger.info(f"Finding image for event {i+1}/{len(events)}: {event_name}")
-        image_url = find_event_image(event_name, event_location)
-        
-        # Use default if no image found
-        image_url = image_url or "https://picsum.photos/800/600"
-        
-        # Add the image URL to both fields for compatibility
-        event['imageURL'] = image_url  # For internal pipeline use
-        event['image'] = image_url     # For API compatibility
-        
-        # Add a small delay to avoid rate limiting
-        if i < len(events) - 1:  # No need to delay after the last item
-            time.sleep(1)  # 1 second delay
-    
-    logger.info("Finished attaching images to all events")
-    return events
-
-def process_event_batch(events: List[Dict[str, Any]], batch_size: int = 5) -> List[Dict[str, Any]]:
-    """
-    Process events in batches to avoid rate limiting with the Google API.
-    
-    Args:
-        events: List of event dictionaries
-        batch_size: Number of events to process in each batch
-        
-    Returns:
-        List of event dictionaries with added image and imageURL fields
-    """
-    total_events = len(events)
-    processed_events = []
-    
-    for i in range(0, total_events, batch_size):
-        batch = events[i:i+batch_size]
-        logger.info(f"Processing batch {i//batch_size + 1}/{(total_events+batch_size-1)//batch_size}")
-        
-        # Process this batch
-        processed_batch = attach_images(batch)
-        processed_events.extend(processed_batch)
-        
-        # Add a delay between batches to avoid rate limiting
-        if i + batch_size < total_events:  # No need to delay after the last batch
-            logger.info("Waiting between batches to avoid rate limiting...")
-            time.sleep(3)  # 3 second delay between batches
-    
-    return processed_events
-
-# Example usage if run directly
-if __name__ == "__main__":
-    # Test with a few sample events
-    sample_events = [
-        {
-            "name": "WSRE Wine & Food Classic",
-            "city": "Pensacola",
-            "state": "Florida",
-            "country": "United States",
-            "description": "A celebration of regional flavors featuring fine wines and gourmet dishes."
-        },
-        {
-            "name": "Gulf Coast Whale Festival",
-            "city": "Pensacola Beach",
-            "state": "Florida",
-            "country": "United States",
-            "description": "Celebrate the wonders of the Gulf with educational exhibits, a marine life puppet parade, and live music."
-        }
-    ]
-    
-    # Attach images to the sample events
-    events_with_images = process_event_batch(sample_events)
-    
-    # Print the results
-    for event in events_with_images:
-        print(f"Event: {event.get('name')}")
-        print(f"Image URL: {event.get('imageURL')}")
-        print(f"Image field: {event.get('image')}")
-        print("-----")
\ No newline at end of file
+# EventImageAttacher.py
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import time
+from typing import List, Dict, Any, Optional
+import aiohttp
+import logging
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('EventImageAttacher')
+
+# API Configuration
+GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+SEARCH_ENGINE_ID = os.environ.get("SEARCH_ENGINE_ID")
+
+# Log warning if API keys are missing
+if not GOOGLE_API_KEY or not SEARCH_ENGINE_ID:
+    logger.warning("GOOGLE_API_KEY or SEARCH_ENGINE_ID environment variables are not set. Image search will be disabled.")
+
+# Google Custom Search REST endpoint, queried directly instead of going
+# through the googleapiclient discovery machinery
+CSE_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
+
+# Fallback image when no result is found
+DEFAULT_IMAGE_URL = "https://picsum.photos/800/600"
+
+# Maximum number of image searches in flight at once
+IMAGE_SEARCH_CONCURRENCY = int(os.environ.get("IMAGE_SEARCH_CONCURRENCY", "5"))
+
+# Persistent cache of image-search results so repeat runs over the same
+# city skip both the HTTP call and its rate-limit budget
+IMAGE_CACHE_FILE = os.environ.get("EVENT_IMAGE_CACHE_FILE", "event_image_cache.db")
+IMAGE_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+
+_IMAGE_CACHE: Dict[str, str] = {}
+
+def _image_cache_connect() -> sqlite3.Connection:
+    """Open the image cache database, creating the table if needed."""
+    conn = sqlite3.connect(IMAGE_CACHE_FILE)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, image_url TEXT, ts INTEGER)")
+    return conn
+
+def _load_image_cache() -> None:
+    """Warm the in-memory image cache from disk, skipping expired entries."""
+    try:
+        conn = _image_cache_connect()
+        cutoff = int(time.time()) - IMAGE_CACHE_TTL_SECONDS
+        for key, image_url in conn.execute("SELECT key, image_url FROM cache WHERE ts >= ?", (cutoff,)):
+            _IMAGE_CACHE[key] = image_url
+        conn.close()
+        if _IMAGE_CACHE:
+            logger.info(f"Loaded {len(_IMAGE_CACHE)} cached image results from {IMAGE_CACHE_FILE}")
+    except Exception as e:
+        logger.warning(f"Could not load image cache: {e}")
+
+def _store_image_cache(cache_key: str, image_url: str) -> None:
+    """Persist a found image URL to memory and disk."""
+    _IMAGE_CACHE[cache_key] = image_url
+    try:
+        conn = _image_cache_connect()
+        conn.execute("INSERT OR REPLACE INTO cache (key, image_url, ts) VALUES (?, ?, ?)",
+                     (cache_key, image_url, int(time.time())))
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        logger.warning(f"Could not persist image cache entry: {e}")
+
+def _image_cache_key(event_title: str, event_location: str) -> str:
+    """Build a normalized cache key from the event title and location."""
+    raw = f"{event_title.lower().strip()}|{event_location.lower()}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+_load_image_cache()
+
+# Google CSE quota budgets: requests per second and per rolling 100 seconds
+IMAGE_SEARCH_QPS = int(os.environ.get("IMAGE_SEARCH_QPS", "10"))
+IMAGE_SEARCH_QUOTA_100S = int(os.environ.get("IMAGE_SEARCH_QUOTA_100S", "100"))
+
+class _RateLimiter:
+    """
+    Token bucket pacing requests against the CSE quota.
+
+    Two buckets (per-second and per-100-seconds) refill lazily from elapsed
+    monotonic time, so there is no background task; acquire() admits a
+    request as soon as both buckets have budget, sleeping only as long as
+    the emptier bucket needs.
+    """
+
+    def __init__(self, qps: int, quota_100s: int):
+        self._qps = qps
+        self._quota_100s = quota_100s
+        self._second_tokens = float(qps)
+        self._window_tokens = float(quota_100s)
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._second_tokens = min(float(self._qps), self._second_tokens + elapsed * self._qps)
+        self._window_tokens = min(float(self._quota_100s), self._window_tokens + elapsed * self._quota_100s / 100.0)
+
+    async def acquire(self) -> None:
+        while True:
+            self._refill()
+            if self._second_tokens >= 1.0 and self._window_tokens >= 1.0:
+                self._second_tokens -= 1.0
+                self._window_tokens -= 1.0
+                return
+            wait_second = (1.0 - self._second_tokens) / self._qps if self._second_tokens < 1.0 else 0.0
+            wait_window = (1.0 - self._window_tokens) * 100.0 / self._quota_100s if self._window_tokens < 1.0 else 0.0
+            await asyncio.sleep(max(wait_second, wait_window, 0.01))
+
+_RATE_LIMITER = _RateLimiter(IMAGE_SEARCH_QPS, IMAGE_SEARCH_QUOTA_100S)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors.
+# 403 (daily quota exhausted) is deliberately excluded - it will not
+# recover within the backoff window.
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503})
+
+def _classify_status(status: int) -> str:
+    """Return a short label for an HTTP error status, for log readability."""
+    if status == 429:
+        return 'rate_limit'
+    if status == 403:
+        return 'quota'
+    if status >= 500:
+        return 'server'
+    return 'client'
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Decide whether a failed CSE request is worth retrying."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in _RETRYABLE_STATUSES
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+async def _cse_request(session: aiohttp.ClientSession, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Perform one Custom Search request with capped exponential-backoff retries.
+
+    Args:
+        session: Shared aiohttp session for the request
+        params: Query parameters for the CSE endpoint
+
+    Returns:
+        Decoded JSON response body
+
+    Raises:
+        aiohttp.ClientResponseError: If the request still fails after retries
+    """
+    async for attempt in AsyncRetrying(retry=retry_if_exception(_is_retryable),
+                                       wait=wait_exponential_jitter(initial=1, max=30),
+                                       stop=stop_after_attempt(3),
+                                       reraise=True):
+        with attempt:
+            await _RATE_LIMITER.acquire()
+            async with session.get(CSE_ENDPOINT, params=params) as response:
+                if response.status in _RETRYABLE_STATUSES:
+                    reason = _classify_status(response.status)
+                    retry_after = response.headers.get('Retry-After')
+                    logger.warning(f"CSE request failed with {response.status} ({reason}), will retry"
+                                   + (f" after {retry_after}s" if retry_after else ""))
+                    if retry_after:
+                        try:
+                            await asyncio.sleep(float(retry_after))
+                        except ValueError:
+                            pass
+                response.raise_for_status()
+                return await response.json()
+
+# Shared HTTP session reused across attach_images_async calls so keep-alive
+# connections (and their TLS handshakes) are amortized over the whole run
+# instead of paid once per batch. Rebuilt if the running loop changes, e.g.
+# between separate asyncio.run invocations.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use.
+
+    Returns:
+        An open aiohttp.ClientSession bound to the running event loop
+    """
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        if _SESSION is not None and not _SESSION.closed:
+            # Superseded session from a previous loop (separate asyncio.run
+            # calls): close it so its connector's sockets don't leak. Its
+            # loop is usually already dead, so fall back to detach().
+            try:
+                await _SESSION.close()
+            except RuntimeError:
+                _SESSION.detach()
+        # Generous keep-alive so connections survive gaps between batches,
+        # and a DNS cache so repeat requests skip the resolver entirely
+        connector = aiohttp.TCPConnector(limit=IMAGE_SEARCH_CONCURRENCY,
+                                         limit_per_host=IMAGE_SEARCH_CONCURRENCY,
+                                         keepalive_timeout=60,
+                                         ttl_dns_cache=300)
+        # Hard 10s budget per request so one slow search can't stall a batch
+        _SESSION = aiohttp.ClientSession(connector=connector,
+                                         timeout=aiohttp.ClientTimeout(total=10))
+        _SESSION_LOOP = loop
+    return _SESSION
+
+async def find_event_image(session: aiohttp.ClientSession, event_title: str, event_location: str) -> Optional[str]:
+    """
+    Find an image for the event using the Google Custom Search API.
+
+    Args:
+        session: Shared aiohttp session for the search requests
+        event_title: Title of the event
+        event_location: Location of the event (city, state)
+
+    Returns:
+        URL of the image if found, None otherwise
+    """
+    if not GOOGLE_API_KEY or not SEARCH_ENGINE_ID:
+        logger.error("GOOGLE_API_KEY or SEARCH_ENGINE_ID is not set. Cannot search for images.")
+        return None
+
+    cache_key = _image_cache_key(event_title, event_location)
+    cached_url = _IMAGE_CACHE.get(cache_key)
+    if cached_url:
+        logger.info(f"Using cached image for '{event_title}': {cached_url}")
+        return cached_url
+
+    query = f"{event_title} {event_location} event"
+    logger.info(f"Searching for image with query: '{query}'")
+
+    params = {
+        'key': GOOGLE_API_KEY,
+        'cx': SEARCH_ENGINE_ID,
+        'q': query,
+        'searchType': 'image',
+        'num': 1,
+        'imgSize': 'LARGE',  # Note: UPPERCASE is required by the API
+        'safe': 'active'     # Safe search
+    }
+
+    try:
+        results = await _cse_request(session, params)
+
+        images = results.get('items', [])
+        if images:
+            image_url = images[0]['link']
+            logger.info(f"Found image for '{event_title}': {image_url}")
+            _store_image_cache(cache_key, image_url)
+            return image_url
+        else:
+            logger.warning(f"No images found for '{event_title}'")
+
+    except aiohttp.ClientResponseError as e:
+        logger.error(f"Giving up on image for '{event_title}': HTTP {e.status} ({_classify_status(e.status)})")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # Expected transport hiccups: one short classified line, no traceback
+        logger.error(f"Error finding image for '{event_title}': {type(e).__name__}: {str(e)[:200]}")
+    except Exception:
+        # Truly unexpected failures keep the full traceback
+        logger.exception(f"Unexpected error finding image for '{event_title}'")
+
+    return None
+
+async def _attach_one(session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                      event: Dict[str, Any], index: int, total: int) -> Dict[str, Any]:
+    """
+    Attach an image to a single event, respecting the concurrency cap.
+
+    Args:
+        session: Shared aiohttp session for the search requests
+        sem: Semaphore limiting in-flight searches
+        event: Event dictionary to update in place
+        index: Position of the event in the batch (for logging)
+        total: Total number of events in the batch (for logging)
+
+    Returns:
+        The event dictionary with image and imageURL fields set
+    """
+    # Bind lookups once per event instead of chaining .get() calls
+    event_name = event.get('name') or event.get('title') or ''
+
+    if not event_name:
+        logger.warning(f"Event {index+1}/{total} has no name/title, skipping image search")
+        event['imageURL'] = event['image'] = DEFAULT_IMAGE_URL
+        return event
+
+    city = event.get('city') or ''
+    state = event.get('state') or ''
+    event_location = f"{city}, {state}" if city or state else ''
+
+    # Find image for the event
+    logger.info(f"Finding image for event {index+1}/{total}: {event_name}")
+    async with sem:
+        image_url = await find_event_image(session, event_name, event_location)
+
+    # Use default if no image found; set both fields for compatibility
+    event['imageURL'] = event['image'] = image_url or DEFAULT_IMAGE_URL
+    return event
+
+async def attach_images_async(events: List[Dict[str, Any]], concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Process a list of events concurrently and attach image URLs to each.
+
+    Args:
+        events: List of event dictionaries
+        concurrency: Maximum number of searches in flight (defaults to IMAGE_SEARCH_CONCURRENCY)
+
+    Returns:
+        List of event dictionaries with added image and imageURL fields
+    """
+    if not events:
+        logger.warning("No events to process for image attachment")
+        return events
+
+    logger.info(f"Attaching images to {len(events)} events")
+
+    # Partition up front: events that already have an image just need the
+    # 'image' mirror for API compatibility and skip the fetch machinery
+    need_fetch = []
+    for event in events:
+        existing_url = event.get('imageURL')
+        if existing_url:
+            event['image'] = existing_url
+        else:
+            need_fetch.append(event)
+
+    if len(need_fetch) < len(events):
+        logger.info(f"{len(events) - len(need_fetch)} events already have images, searching for {len(need_fetch)}")
+
+    if need_fetch:
+        # Events sharing (name, city, state) - recurring series like a weekly
+        # farmers market - get one search, fanned out to every duplicate
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for event in need_fetch:
+            key = (event.get('name') or event.get('title') or '',
+                   event.get('city') or '', event.get('state') or '')
+            groups.setdefault(key, []).append(event)
+
+        leaders = [members[0] for members in groups.values()]
+        if len(leaders) < len(need_fetch):
+            logger.info(f"Deduplicated {len(need_fetch) - len(leaders)} repeated image queries in this batch")
+
+        sem = asyncio.Semaphore(concurrency or IMAGE_SEARCH_CONCURRENCY)
+        session = await _get_session()
+        results = await asyncio.gather(
+            *[_attach_one(session, sem, event, i, len(leaders)) for i, event in enumerate(leaders)],
+            return_exceptions=True
+        )
+
+        # Make sure events whose task blew up still get a usable image
+        # field, then copy each group's result onto its duplicates
+        for members, result in zip(groups.values(), results):
+            leader = members[0]
+            if isinstance(result, Exception):
+                logger.error(f"Image attachment failed for '{leader.get('name', leader.get('title', 'Unnamed event'))}': {result}")
+                if not leader.get('imageURL'):
+                    leader['imageURL'] = DEFAULT_IMAGE_URL
+                leader['image'] = leader['imageURL']
+            for follower in members[1:]:
+                follower['imageURL'] = follower['image'] = leader['imageURL']
+
+    logger.info("Finished attaching images to all events")
+    return events
+
+def attach_images(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Synchronous wrapper around attach_images_async for callers without an event loop.
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        List of event dictionaries with added image and imageURL fields
+    """
+    return asyncio.run(attach_images_async(events))
+
+async def process_event_batch(events: List[Dict[str, Any]], batch_size: int = 5,
+                              max_concurrent_batches: int = 3) -> List[Dict[str, Any]]:
+    """
+    Process events in concurrent batches; the token-bucket limiter keeps
+    the combined request rate within the Google API quota.
+
+    Args:
+        events: List of event dictionaries
+        batch_size: Number of events to process in each batch
+        max_concurrent_batches: Number of batches allowed to run at once
+
+    Returns:
+        List of event dictionaries with added image and imageURL fields
+    """
+    total_events = len(events)
+    total_batches = (total_events + batch_size - 1) // batch_size
+    sem = asyncio.Semaphore(max_concurrent_batches)
+
+    async def _run_batch(batch_number: int, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        async with sem:
+            logger.info(f"Processing batch {batch_number}/{total_batches}")
+            return await attach_images_async(batch, concurrency=batch_size)
+
+    batches = [events[i:i+batch_size] for i in range(0, total_events, batch_size)]
+    results = await asyncio.gather(*[_run_batch(n + 1, batch) for n, batch in enumerate(batches)])
+
+    processed_events = []
+    for processed_batch in results:
+        processed_events.extend(processed_batch)
+    return processed_events
+
+# Example usage if run directly
+if __name__ == "__main__":
+    # Test with a few sample events
+    sample_events = [
+        {
+            "name": "WSRE Wine & Food Classic",
+            "city": "Pensacola",
+            "state": "Florida",
+            "country": "United States",
+            "description": "A celebration of regional flavors featuring fine wines and gourmet dishes."
+        },
+        {
+            "name": "Gulf Coast Whale Festival",
+            "city": "Pensacola Beach",
+            "state": "Florida",
+            "country": "United States",
+            "description": "Celebrate the wonders of the Gulf with educational exhibits, a marine life puppet parade, and live music."
+        }
+    ]
+
+    # Attach images to the sample events
+    events_with_images = asyncio.run(process_event_batch(sample_events))
+
+    # Print the results
+    for event in events_with_images:
+        print(f"Event: {event.get('name')}")
+        print(f"Image URL: {event.get('imageURL')}")
+        print(f"Image field: {event.get('image')}")
+        print("-----")
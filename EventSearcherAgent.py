@@ -1,297 +1,465 @@
-# EventSearcherAgent.py
-
-import asyncio
-import re
-import json
-import logging
-import os
-from datetime import datetime
-from pathlib import Path
-from typing import List, Dict, Any, Optional
-from agents import Agent, WebSearchTool, Runner
-from agents.model_settings import ModelSettings
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('EventSearcherAgent')
-
-# Check for OpenAI API key
-if not os.environ.get("OPENAI_API_KEY"):
-    logger.warning("OPENAI_API_KEY environment variable is not set. The agent will not function correctly.")
-
-# Create folder for saving outputs
-OUTPUTS_FOLDER = Path("EventSearcherAgentOutputs")
-OUTPUTS_FOLDER.mkdir(exist_ok=True)
-
-# Define the agent with specific instructions for structured event data
-event_search_agent = Agent(
-    name="EventSearcher",
-    instructions="""
-    You are an event search assistant specialized in finding upcoming events based on location.
-    For any location query, search the web to find 5 upcoming events in that area. Focus on:
-    1. Concerts, festivals, and live music
-    2. Sports events
-    3. Arts and cultural events
-    4. Food and drink festivals
-    5. Community events and fundraisers
-    
-    For each event, extract and provide the following information:
-    - Title of the event
-    - Date and time (provide exact start_date, start_time, end_date, end_time in format YYYY-MM-DD and HH:MM:SS)
-    - Venue or location (include specific venue name)
-    - Full address of the venue (provide as much detail as possible)
-    - City, state, and country
-    - Brief description (1-2 sentences, maximum 150 characters)
-    - Link to the event page if available
-    
-    Always prioritize events happening in the near future (next 2-3 months).
-    
-    IMPORTANT: Find EXACTLY 5 events. Return ONLY a JSON array with these 5 events - no introductory text, 
-    no conclusions, no explanations. Each event should have these exact keys:
-    "title", "start_date", "start_time", "end_date", "end_time", "venue", "address", "city", "state", "country", 
-    "description", "url"
-    
-    For dates, use YYYY-MM-DD format.
-    For times, use HH:MM:SS format (24-hour).
-    If end date is unknown, use the same as start date.
-    If end time is unknown, use 23:59:59.
-    The address field should contain the full venue address when available.
-    
-    KEEP YOUR RESPONSE CONCISE. DO NOT EXCEED 5 EVENTS.
-    """,
-    tools=[WebSearchTool()],
-    model_settings=ModelSettings(
-        temperature=0.2,
-        tool_choice="required",  # Force usage of the WebSearchTool
-        max_tokens=2500  # Explicitly limit the response size
-    ),
-)
-
-def save_output(location: str, stage: str, content: Any) -> str:
-    """
-    Save agent output or parsed events to a file for debugging.
-    
-    Args:
-        location: The location being searched
-        stage: The processing stage (e.g., "raw_output", "parsed_events")
-        content: The content to save
-    
-    Returns:
-        Path to the saved file
-    """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_location = location.replace(", ", "_").replace(" ", "_")
-    filename = f"{safe_location}_{stage}_{timestamp}.json"
-    filepath = OUTPUTS_FOLDER / filename
-    
-    with open(filepath, "w", encoding="utf-8") as f:
-        if isinstance(content, str):
-            f.write(content)
-        else:
-            json.dump(content, f, indent=2)
-    
-    logger.info(f"Saved {stage} to {filepath}")
-    return str(filepath)
-
-def fix_incomplete_json(json_str: str) -> str:
-    """
-    Attempt to fix incomplete JSON, like missing closing brackets.
-    
-    Args:
-        json_str: A potentially incomplete JSON string
-        
-    Returns:
-        Fixed JSON string if possible, original string otherwise
-    """
-    # Count opening and closing brackets
-    open_brackets = json_str.count('[')
-    close_brackets = json_str.count(']')
-    open_braces = json_str.count('{')
-    close_braces = json_str.count('}')
-    
-    # Fix missing closing brackets if needed
-    if open_brackets > close_brackets:
-        json_str += ']' * (open_brackets - close_brackets)
-        logger.info(f"Added {open_brackets - close_brackets} missing closing brackets")
-    
-    # Fix missing closing braces if needed
-    if open_braces > close_braces:
-        json_str += '}' * (open_braces - close_braces)
-        logger.info(f"Added {open_braces - close_braces} missing closing braces")
-    
-    # Handle truncated JSON at a comma
-    if json_str.rstrip().endswith(','):
-        json_str = json_str.rstrip()[:-1]  # Remove trailing comma
-        logger.info("Removed trailing comma")
-    
-    # Check and fix truncated property
-    if '"' in json_str:
-        last_quote_pos = json_str.rfind('"')
-        last_brace_pos = json_str.rfind('}')
-        last_bracket_pos = json_str.rfind(']')
-        
-        # If the last quote is after the last closing structure, we might have a truncated property
-        if last_quote_pos > max(last_brace_pos, last_bracket_pos):
-            # Find the last valid closing structure position
-            if last_brace_pos > last_bracket_pos:
-                json_str = json_str[:last_brace_pos+1]
-                if open_brackets > close_brackets:
-                    json_str += ']'
-            else:
-                json_str = json_str[:last_bracket_pos+1]
-            
-            logger.info("Fixed truncated property")
-    
-    return json_str
-
-def parse_event_data(event_text: str, location: str) -> List[Dict[str, Any]]:
-    """
-    Robust parser for extracting event data from the agent's output text.
-    Tries multiple parsing strategies to handle different formats.
-    
-    Args:
-        event_text: Raw text from the agent
-        location: Location being searched, for saving debug files
-        
-    Returns:
-        List of event dictionaries
-    """
-    # Save raw output for debugging
-    save_output(location, "raw_output", event_text)
-    
-    events = []
-    parse_method = "none"
-    
-    # Strategy 1: Look for JSON array in markdown code block
-    json_block_match = re.search(r'```(?:json)?\s*(\[\s*\{.*?\}\s*\](?:\s*\})?)```', event_text, re.DOTALL)
-    if json_block_match:
-        try:
-            json_content = json_block_match.group(1)
-            json_content = fix_incomplete_json(json_content)
-            events = json.loads(json_content)
-            parse_method = "code_block"
-            logger.info(f"Successfully parsed JSON from code block, found {len(events)} events")
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse JSON from code block: {e}")
-    
-    # Strategy 2: Look for JSON array directly in text with more flexible pattern
-    if not events:
-        json_match = re.search(r'\[\s*\{.*?\}\s*(?:\,\s*\{.*?\}\s*)*\]', event_text, re.DOTALL)
-        if json_match:
-            try:
-                json_content = json_match.group(0)
-                json_content = fix_incomplete_json(json_content)
-                events = json.loads(json_content)
-                parse_method = "regex_match"
-                logger.info(f"Successfully parsed JSON from text, found {len(events)} events")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse JSON from text: {e}")
-    
-    # Strategy 3: Try to parse entire text
-    if not events:
-        try:
-            json_content = fix_incomplete_json(event_text)
-            events = json.loads(json_content)
-            if isinstance(events, list) and len(events) > 0:
-                parse_method = "entire_text"
-                logger.info(f"Successfully parsed entire text as JSON, found {len(events)} events")
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse entire text as JSON: {e}")
-    
-    # Strategy 4: Extract substring between first '[' and last ']' and fix it
-    if not events:
-        start_index = event_text.find('[')
-        end_index = event_text.rfind(']')
-        if start_index != -1 and end_index != -1 and start_index < end_index:
-            try:
-                json_substring = event_text[start_index:end_index+1]
-                json_substring = fix_incomplete_json(json_substring)
-                events = json.loads(json_substring)
-                parse_method = "substring"
-                logger.info(f"Successfully parsed JSON using substring extraction, found {len(events)} events")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse JSON substring: {e}")
-    
-    # Strategy 5: Very aggressive approach - extract any JSON-like content
-    if not events:
-        try:
-            # Find all potential objects
-            objects = re.findall(r'(\{[^{}]*"title":[^{}]*\})', event_text)
-            if objects:
-                # Reconstruct a JSON array with these objects
-                reconstructed_json = "[" + ",".join(objects) + "]"
-                reconstructed_json = fix_incomplete_json(reconstructed_json)
-                events = json.loads(reconstructed_json)
-                parse_method = "object_extraction"
-                logger.info(f"Successfully parsed JSON by extracting individual objects, found {len(events)} events")
-        except (json.JSONDecodeError, re.error) as e:
-            logger.warning(f"Failed to parse JSON with object extraction: {e}")
-    
-    if not events:
-        logger.warning("Could not extract events from text using any parsing strategy")
-        logger.warning(f"Raw output (first 500 chars): {event_text[:500]}")
-    
-    # Save parsed events for debugging
-    save_output(
-        location, 
-        f"parsed_events_{parse_method}", 
-        {"method": parse_method, "count": len(events), "events": events}
-    )
-    
-    return events
-
-async def search_events(location: str, limit: int = 5) -> List[Dict[str, Any]]:
-    """
-    Search for events at the given location using the AI agent
-    
-    Args:
-        location: Location to search for events (e.g., "Pensacola, Florida")
-        limit: Maximum number of events to return (default is now 5)
-        
-    Returns:
-        List of event dictionaries with structured information
-    """
-    # Query the agent - explicitly request exactly 5 events with full venue addresses
-    query = f"Find exactly 5 upcoming events in {location}, including full venue addresses, and return only a JSON array with no other text"
-    logger.info(f"Searching for 5 events in {location} (with addresses)")
-    
-    # Save search query for debugging
-    save_output(location, "search_query", query)
-    
-    # Run the agent
-    result = await Runner.run(event_search_agent, query)
-    
-    # Get the raw output
-    text_output = result.final_output
-    
-    # Try to parse the result
-    events_data = parse_event_data(text_output, location)
-    
-    if not events_data:
-        logger.warning(f"No events found for {location}")
-    else:
-        logger.info(f"Found {len(events_data)} events for {location}")
-    
-    # Return the events (already limited to 5 by the agent)
-    return events_data
-
-# Example usage if run directly
-async def main():
-    location = "Pensacola, Florida"
-    events = await search_events(location)
-    
-    if events:
-        print(f"Found {len(events)} events in {location}")
-        print("\nExample event:")
-        print(json.dumps(events[0], indent=2))
-    else:
-        print(f"No events found in {location}")
-
-if __name__ == "__main__":
-    # For regular Python environments
-    asyncio.run(main())
-    
-    # For Jupyter/Colab environments (uncomment if needed)
-    # import nest_asyncio
-    # nest_asyncio.apply()
+# EventSearcherAgent.py
+
+import asyncio
+import re
+import json
+import logging
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from agents import Agent, WebSearchTool, Runner
+from agents.model_settings import ModelSettings
+
+# orjson decodes/encodes large agent outputs several times faster than the
+# stdlib; fall back silently when it isn't installed. Its JSONDecodeError
+# subclasses json.JSONDecodeError, so the except clauses below cover both.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Text-delta event type for streamed runs; absent on older SDKs, in which
+# case search_events falls back to the non-streaming path
+try:
+    from openai.types.responses import ResponseTextDeltaEvent
+except ImportError:
+    ResponseTextDeltaEvent = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('EventSearcherAgent')
+
+# Check for OpenAI API key
+if not os.environ.get("OPENAI_API_KEY"):
+    logger.warning("OPENAI_API_KEY environment variable is not set. The agent will not function correctly.")
+
+# Folder for saving debug outputs; only written when EVENT_DEBUG_SAVE=1
+OUTPUTS_FOLDER = Path("EventSearcherAgentOutputs")
+DEBUG_SAVE = os.environ.get("EVENT_DEBUG_SAVE", "0") == "1"
+
+# Matches individual event-shaped objects in otherwise unparseable output;
+# compiled once so the fallback path doesn't rebuild it per call
+_OBJECT_RE = re.compile(r'(\{[^{}]*"title":[^{}]*\})')
+
+# Single-pass filename sanitizer: commas dropped, spaces become underscores
+_SAFE_FILENAME_TBL = str.maketrans({',': None, ' ': '_'})
+
+def _json_loads(text: str) -> Any:
+    """Decode JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# The exact keys every event object must carry
+_EVENT_FIELDS = ("title", "start_date", "start_time", "end_date", "end_time",
+                 "venue", "address", "city", "state", "country", "description", "url")
+
+# JSON schema enforced via structured outputs so the model emits a bare
+# {"events": [...]} object instead of markdown-fenced or chatty text
+_EVENTS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "events",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "events": {
+                    "type": "array",
+                    "maxItems": 5,
+                    "items": {
+                        "type": "object",
+                        "properties": {field: {"type": "string"} for field in _EVENT_FIELDS},
+                        "required": list(_EVENT_FIELDS),
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["events"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Define the agent with specific instructions for structured event data
+event_search_agent = Agent(
+    name="EventSearcher",
+    instructions="""
+    You are an event search assistant specialized in finding upcoming events based on location.
+    For any location query, search the web to find 5 upcoming events in that area. Focus on:
+    1. Concerts, festivals, and live music
+    2. Sports events
+    3. Arts and cultural events
+    4. Food and drink festivals
+    5. Community events and fundraisers
+    
+    For each event, extract and provide the following information:
+    - Title of the event
+    - Date and time (provide exact start_date, start_time, end_date, end_time in format YYYY-MM-DD and HH:MM:SS)
+    - Venue or location (include specific venue name)
+    - Full address of the venue (provide as much detail as possible)
+    - City, state, and country
+    - Brief description (1-2 sentences, maximum 150 characters)
+    - Link to the event page if available
+    
+    Always prioritize events happening in the near future (next 2-3 months).
+    
+    IMPORTANT: Find EXACTLY 5 events. Return ONLY a JSON object of the form
+    {"events": [...]} with these 5 events - no introductory text, no conclusions,
+    no explanations. Each event should have these exact keys:
+    "title", "start_date", "start_time", "end_date", "end_time", "venue", "address", "city", "state", "country", 
+    "description", "url"
+    
+    For dates, use YYYY-MM-DD format.
+    For times, use HH:MM:SS format (24-hour).
+    If end date is unknown, use the same as start date.
+    If end time is unknown, use 23:59:59.
+    The address field should contain the full venue address when available.
+    
+    KEEP YOUR RESPONSE CONCISE. DO NOT EXCEED 5 EVENTS.
+    """,
+    tools=[WebSearchTool()],
+    model_settings=ModelSettings(
+        temperature=0.2,
+        tool_choice="required",  # Force usage of the WebSearchTool
+        max_tokens=1500,  # Structured output has no boilerplate, so 2500 was slack
+        extra_args={"response_format": _EVENTS_RESPONSE_FORMAT},
+    ),
+)
+
+def save_output(location: str, stage: str, content: Any, timestamp: Optional[str] = None) -> str:
+    """
+    Save agent output or parsed events to a file for debugging.
+
+    Args:
+        location: The location being searched
+        stage: The processing stage (e.g., "raw_output", "parsed_events")
+        content: The content to save
+        timestamp: Pre-formatted timestamp to reuse across related saves
+
+    Returns:
+        Path to the saved file
+    """
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_location = location.translate(_SAFE_FILENAME_TBL)
+    filename = f"{safe_location}_{stage}_{timestamp}.json"
+    OUTPUTS_FOLDER.mkdir(exist_ok=True)
+    filepath = OUTPUTS_FOLDER / filename
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        if isinstance(content, str):
+            f.write(content)
+        elif orjson is not None:
+            f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2).decode())
+        else:
+            json.dump(content, f, indent=2)
+    
+    logger.info(f"Saved {stage} to {filepath}")
+    return str(filepath)
+
+def _log_save_failure(future) -> None:
+    """Surface exceptions from fire-and-forget debug saves in the log."""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning(f"Background debug save failed: {exc}")
+
+def _save_output_background(location: str, stage: str, content: Any,
+                            timestamp: Optional[str] = None) -> None:
+    """
+    Schedule a save_output call without blocking the event loop.
+
+    No-op unless EVENT_DEBUG_SAVE=1, so production runs skip the disk
+    writes entirely. When a loop is running, the write is offloaded to
+    the default executor; otherwise it runs inline.
+
+    Args:
+        location: The location being searched
+        stage: The processing stage (e.g., "raw_output", "parsed_events")
+        content: The content to save
+        timestamp: Pre-formatted timestamp to reuse across related saves
+    """
+    if not DEBUG_SAVE:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        save_output(location, stage, content, timestamp)
+        return
+    future = loop.run_in_executor(None, save_output, location, stage, content, timestamp)
+    future.add_done_callback(_log_save_failure)
+
+def fix_incomplete_json(json_str: str) -> str:
+    """
+    Attempt to fix incomplete JSON, like missing closing brackets.
+    
+    Args:
+        json_str: A potentially incomplete JSON string
+        
+    Returns:
+        Fixed JSON string if possible, original string otherwise
+    """
+    # Count opening and closing brackets in a single pass over the string
+    counts = Counter(json_str)
+    open_brackets = counts['[']
+    close_brackets = counts[']']
+    open_braces = counts['{']
+    close_braces = counts['}']
+    
+    # Fix missing closing brackets if needed
+    if open_brackets > close_brackets:
+        json_str += ']' * (open_brackets - close_brackets)
+        logger.info(f"Added {open_brackets - close_brackets} missing closing brackets")
+    
+    # Fix missing closing braces if needed
+    if open_braces > close_braces:
+        json_str += '}' * (open_braces - close_braces)
+        logger.info(f"Added {open_braces - close_braces} missing closing braces")
+    
+    # Handle truncated JSON at a comma
+    if json_str.rstrip().endswith(','):
+        json_str = json_str.rstrip()[:-1]  # Remove trailing comma
+        logger.info("Removed trailing comma")
+    
+    # Check and fix truncated property
+    if '"' in json_str:
+        last_quote_pos = json_str.rfind('"')
+        last_brace_pos = json_str.rfind('}')
+        last_bracket_pos = json_str.rfind(']')
+        
+        # If the last quote is after the last closing structure, we might have a truncated property
+        if last_quote_pos > max(last_brace_pos, last_bracket_pos):
+            # Find the last valid closing structure position
+            if last_brace_pos > last_bracket_pos:
+                json_str = json_str[:last_brace_pos+1]
+                if open_brackets > close_brackets:
+                    json_str += ']'
+            else:
+                json_str = json_str[:last_bracket_pos+1]
+            
+            logger.info("Fixed truncated property")
+    
+    return json_str
+
+def _extract_json_array(text: str) -> Optional[List[Any]]:
+    """
+    Find and parse the first JSON array in text with a single forward scan.
+
+    Attempts a raw_decode at each '[' located with str.find, so markdown
+    fences and surrounding prose are skipped without any backtracking
+    regex passes over the full output.
+
+    Args:
+        text: Raw text that may contain a JSON array
+
+    Returns:
+        The first successfully parsed list, or None if no valid array exists
+    """
+    decoder = json.JSONDecoder()
+    i = 0
+    while True:
+        i = text.find('[', i)
+        if i < 0:
+            return None
+        try:
+            parsed, _ = decoder.raw_decode(text, i)
+            if isinstance(parsed, list):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+        i += 1
+
+def parse_event_data(event_text: str, location: str) -> List[Dict[str, Any]]:
+    """
+    Robust parser for extracting event data from the agent's output text.
+    A single raw_decode scan handles well-formed output; repair fallbacks
+    only run when the output is truncated or malformed.
+
+    Args:
+        event_text: Raw text from the agent
+        location: Location being searched, for saving debug files
+
+    Returns:
+        List of event dictionaries
+    """
+    # Save raw output for debugging (background, debug-only); one timestamp
+    # shared by both saves so the files pair up on disk
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") if DEBUG_SAVE else None
+    _save_output_background(location, "raw_output", event_text, timestamp)
+
+    events = []
+    parse_method = "none"
+
+    # Fastest path: structured outputs return a bare {"events": [...]} object
+    stripped = event_text.lstrip()
+    if stripped.startswith('{'):
+        try:
+            payload = _json_loads(stripped)
+            if isinstance(payload, dict) and isinstance(payload.get('events'), list):
+                events = payload['events']
+                parse_method = "structured"
+                logger.info(f"Parsed structured output, found {len(events)} events")
+        except json.JSONDecodeError:
+            pass
+
+    # Fast path: single forward scan for the first valid JSON array
+    if not events:
+        parsed = _extract_json_array(event_text)
+        if parsed is not None:
+            events = parsed
+            parse_method = "raw_decode"
+            logger.info(f"Successfully parsed JSON array, found {len(events)} events")
+
+    # Fallback 1: output may be truncated mid-array - repair and re-parse
+    if not events:
+        start_index = event_text.find('[')
+        end_index = event_text.rfind(']')
+        if start_index != -1:
+            json_substring = event_text[start_index:end_index+1] if end_index > start_index else event_text[start_index:]
+            try:
+                json_substring = fix_incomplete_json(json_substring)
+                repaired = _json_loads(json_substring)
+                if isinstance(repaired, list):
+                    events = repaired
+                    parse_method = "fixup"
+                    logger.info(f"Successfully parsed repaired JSON, found {len(events)} events")
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse repaired JSON: {e}")
+
+    # Fallback 2: very aggressive approach - extract any JSON-like content
+    if not events:
+        try:
+            # Find all potential objects
+            objects = _OBJECT_RE.findall(event_text)
+            if objects:
+                # Reconstruct a JSON array with these objects
+                reconstructed_json = "[" + ",".join(objects) + "]"
+                reconstructed_json = fix_incomplete_json(reconstructed_json)
+                events = _json_loads(reconstructed_json)
+                parse_method = "object_extraction"
+                logger.info(f"Successfully parsed JSON by extracting individual objects, found {len(events)} events")
+        except (json.JSONDecodeError, re.error) as e:
+            logger.warning(f"Failed to parse JSON with object extraction: {e}")
+    
+    if not events:
+        logger.warning("Could not extract events from text using any parsing strategy")
+        logger.warning(f"Raw output (first 500 chars): {event_text[:500]}")
+    
+    # Save parsed events for debugging (background, debug-only)
+    _save_output_background(
+        location,
+        f"parsed_events_{parse_method}",
+        {"method": parse_method, "count": len(events), "events": events},
+        timestamp
+    )
+    
+    return events
+
+async def search_events(location: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Search for events at the given location using the AI agent
+    
+    Args:
+        location: Location to search for events (e.g., "Pensacola, Florida")
+        limit: Maximum number of events to return (default is now 5)
+        
+    Returns:
+        List of event dictionaries with structured information
+    """
+    # Query the agent - explicitly request exactly 5 events with full venue addresses
+    query = f"Find exactly 5 upcoming events in {location}, including full venue addresses, and return only a JSON array with no other text"
+    logger.info(f"Searching for 5 events in {location} (with addresses)")
+    
+    # Save search query for debugging (background, debug-only)
+    _save_output_background(location, "search_query", query)
+    
+    # Run the agent, streaming tokens so parsing overlaps generation
+    early_parsed: Optional[List[Any]] = None
+    if ResponseTextDeltaEvent is not None and hasattr(Runner, "run_streamed"):
+        result = Runner.run_streamed(event_search_agent, query)
+        chunks: List[str] = []
+        async for stream_event in result.stream_events():
+            if (stream_event.type == "raw_response_event"
+                    and isinstance(stream_event.data, ResponseTextDeltaEvent)):
+                chunks.append(stream_event.data.delta)
+                # Once a delta closes a bracket the array may already be
+                # complete; try to parse while the model is still wrapping up
+                if early_parsed is None and ']' in stream_event.data.delta:
+                    early_parsed = _extract_json_array(''.join(chunks))
+        text_output = ''.join(chunks) or str(result.final_output or '')
+    else:
+        result = await Runner.run(event_search_agent, query)
+        text_output = result.final_output
+
+    # Try to parse the result, reusing the early parse when it succeeded
+    if early_parsed is not None:
+        _save_output_background(location, "raw_output", text_output)
+        events_data = early_parsed
+        logger.info(f"Parsed {len(events_data)} events from the stream before run completion")
+    else:
+        events_data = parse_event_data(text_output, location)
+    
+    if not events_data:
+        logger.warning(f"No events found for {location}")
+    else:
+        logger.info(f"Found {len(events_data)} events for {location}")
+    
+    # Return the events (already limited to 5 by the agent)
+    return events_data
+
+# Maximum number of location searches in flight at once
+SEARCH_MAX_CONCURRENCY = int(os.environ.get("EVENT_SEARCH_MAX_CONCURRENCY", "5"))
+
+async def search_events_many(locations: List[str], limit: int = 5,
+                             max_concurrency: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Search several locations concurrently with a bounded fan-out.
+
+    Args:
+        locations: Locations to search (e.g., ["Pensacola, Florida", "Mobile, Alabama"])
+        limit: Maximum number of events per location
+        max_concurrency: Maximum searches in flight (defaults to SEARCH_MAX_CONCURRENCY)
+
+    Returns:
+        One list of event dictionaries per location, in input order. A failed
+        location yields an empty list rather than aborting the whole batch.
+    """
+    sem = asyncio.Semaphore(max_concurrency or SEARCH_MAX_CONCURRENCY)
+
+    async def _search_one(location: str) -> List[Dict[str, Any]]:
+        async with sem:
+            return await search_events(location, limit)
+
+    results = await asyncio.gather(*[_search_one(location) for location in locations],
+                                   return_exceptions=True)
+
+    all_events: List[List[Dict[str, Any]]] = []
+    for location, result in zip(locations, results):
+        if isinstance(result, Exception):
+            logger.error(f"Search failed for {location}: {result}")
+            all_events.append([])
+        else:
+            all_events.append(result)
+    return all_events
+
+# Example usage if run directly
+async def main():
+    location = "Pensacola, Florida"
+    events = await search_events(location)
+    
+    if events:
+        print(f"Found {len(events)} events in {location}")
+        print("\nExample event:")
+        print(json.dumps(events[0], indent=2))
+    else:
+        print(f"No events found in {location}")
+
+if __name__ == "__main__":
+    # For regular Python environments
+    asyncio.run(main())
+    
+    # For Jupyter/Colab environments (uncomment if needed)
+    # import nest_asyncio
+    # nest_asyncio.apply()
     # await main()
\ No newline at end of file
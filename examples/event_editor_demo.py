@@ -0,0 +1,101 @@
+# examples/event_editor_demo.py
+#
+# Demo of the EventEditorAgent enhancement and fix flows with sample events.
+#
+# To run with AI description generation, ensure OPENAI_API_KEY is set:
+#   E.g., in Linux/macOS: export OPENAI_API_KEY='your_actual_api_key'
+#   E.g., in Windows (cmd): set OPENAI_API_KEY=your_actual_api_key
+#   E.g., in Windows (PowerShell): $env:OPENAI_API_KEY='your_actual_api_key'
+# Then run: python examples/event_editor_demo.py
+# If the key is not set, it will log warnings and use default/fallback logic.
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from EventEditorAgent import (
+    configure_logging,
+    enhance_event,
+    enhance_events,
+    fix_invalid_events,
+)
+
+
+async def main():
+    # Test case 1: Event missing description, has null coords but also lat/lng
+    sample_event_1 = {
+        "title": "Stellar Spectrum Society Presents: Yewz",
+        "start_date": "2025-03-29", "start_time": "20:00:00",
+        "end_date": "2025-03-30", "end_time": "02:00:00",
+        "venue": "850 Fusion",
+        "address": "7250 Plantation Rd, Pensacola, FL 32504, USA",
+        "city": "Pensacola", "state": "Florida", "country": "United States",
+        "description": "",  # Empty description
+        "url": "https://www.stellarspectrumsociety.com/event-details/yewz",
+        "image": "https://...", "imageURL": "https://...",
+        "latitude": None, "longitude": None, # Null coordinates
+        "lat": 30.497538, "lng": -87.2260669, # But has these valid ones
+        "tag_ids": [] # Empty tags
+    }
+
+    # Test case 2: Event with minimal info, missing coords, tags, district
+    sample_event_2 = {
+        "name": "Community Workshop",
+        "start_date": "2024-09-15", "start_time": "14:00:00",
+        "venue": "Downtown Library",
+        "city": "Anytown", "state": "CA",
+        "description": "A brief workshop description.", # Has a description
+        # Missing coords, tags, district, etc.
+    }
+
+    # Test case 3: Event with invalid coords
+    sample_event_3 = {
+        "name": "Data Glitch Fest",
+        "start_date": "2024-10-01", "start_time": "10:00:00",
+        "venue": "Server Room B",
+        "city": "Tech City", "state": "TX",
+        "description": "",
+        "latitude": "invalid", "longitude": 999 # Invalid lat format, invalid lng value
+    }
+
+    print("--- Enhancing Single Event (Event 1) ---")
+    enhanced_event_1 = await enhance_event(sample_event_1)
+    print("\nOriginal event 1 (subset):")
+    print(json.dumps({k: v for k, v in sample_event_1.items() if k in ['title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
+    print("\nEnhanced event 1 (subset):")
+    print(json.dumps({k: v for k, v in enhanced_event_1.items() if k in ['title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
+
+    print("\n--- Enhancing Multiple Events ---")
+    events_to_enhance = [sample_event_1, sample_event_2, sample_event_3]
+    enhanced_list = await enhance_events(events_to_enhance)
+    print(f"\nSuccessfully processed {len(enhanced_list)} events:")
+    for i, event in enumerate(enhanced_list):
+         print(f"\nEnhanced Event {i+1} ('{event.get('name')}') (subset):")
+         print(json.dumps({k: v for k, v in event.items() if k in ['name', 'title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
+
+    print("\n--- Fixing Invalid Events (Simulated) ---")
+    # Simulate finding invalid events after an API call attempt
+    invalid_event_info = [
+         {
+             "event": sample_event_1, # Missing desc, null coords (but had lat/lng), empty tags
+             "errors": ["description cannot be empty", "tag_ids cannot be empty"] # Example errors
+         },
+         {
+             "event": sample_event_3, # Invalid coords, missing desc
+             "errors": ["description cannot be empty", "Invalid coordinates"]
+         }
+    ]
+
+    fixed_list = await fix_invalid_events(invalid_event_info)
+    print(f"\nAttempted to fix {len(invalid_event_info)} events, resulting in {len(fixed_list)} potentially fixed events:")
+    for i, event in enumerate(fixed_list):
+         print(f"\nPotentially Fixed Event {i+1} ('{event.get('name')}') (subset):")
+         print(json.dumps({k: v for k, v in event.items() if k in ['name', 'title', 'description', 'latitude', 'longitude', 'lat', 'lng', 'tag_ids', 'district']}, indent=2))
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())